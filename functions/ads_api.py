@@ -14,6 +14,7 @@
 """Provides functionality to interact with Google Ads platform."""
 
 from collections.abc import Mapping, Sequence
+from functools import cached_property
 import re
 from typing import TypeAlias
 from absl import logging
@@ -32,6 +33,11 @@ AssetToAssetGroupOperation: TypeAlias = Mapping[
 ]
 AssetGroupOperation = Mapping[str, str]
 
+# YouTube video URL, with the video id in the second group.
+_YT_VIDEO_URL = re.compile(
+    r"^.*(youtu\.be\/|v\/|u\/\w\/|embed\/|shorts\/|watch\?v=|\&v=)([^#\&\?]*).*"
+)
+
 
 class AdService:
   """Provides Google ads API service to interact with Ads platform."""
@@ -47,6 +53,15 @@ class AdService:
     self.prev_image_asset_list = None
     self.prev_customer_id = None
 
+  @cached_property
+  def _googleads_service(self):
+    """GoogleAdsService client shared by all mutate and search requests.
+
+    Every get_service call opens a new gRPC channel, reusing one client keeps
+    a single channel open for all requests of this instance.
+    """
+    return self._google_ads_client.get_service("GoogleAdsService")
+
   def _get_campaign_resource_name(
       self, customer_id: str, campaign_id: str
   ) -> str:
@@ -90,8 +105,7 @@ class AdService:
     Returns:
       String value containing the id, or None.
     """
-    regex = r"^.*(youtu\.be\/|v\/|u\/\w\/|embed\/|shorts\/|watch\?v=|\&v=)([^#\&\?]*).*"
-    result = re.search(regex, video_url)
+    result = _YT_VIDEO_URL.search(video_url)
     if result:
       return result.group(2)
 
@@ -122,7 +136,7 @@ class AdService:
     response = None
     error_message = None
 
-    googleads_service = self._google_ads_client.get_service("GoogleAdsService")
+    googleads_service = self._googleads_service
     request = self._google_ads_client.get_type("MutateGoogleAdsRequest")
     request.customer_id = customer_id
     request.mutate_operations = mutate_operations
@@ -448,7 +462,7 @@ class AdService:
           | CampaignOperation
       ],
       customer_id: str,
-  ) -> Sequence[str]:
+  ) -> Sequence[str | None]:
     """Creates multiple text assets in a single request and returns the list of resource names.
 
     Args:
@@ -457,11 +471,12 @@ class AdService:
       customer_id: Google Ads customer id.
 
     Returns:
-      asset_resource_names: a list of asset resource names.
+      asset_resource_names: a list of asset resource names, one per operation
+        in the order of the operations, None for the failed operations.
     """
     asset_resource_names = []
 
-    googleads_service = self._google_ads_client.get_service("GoogleAdsService")
+    googleads_service = self._googleads_service
     request = self._google_ads_client.get_type("MutateGoogleAdsRequest")
     request.customer_id = customer_id
     request.mutate_operations = operations
@@ -483,9 +498,13 @@ class AdService:
       raise ex
 
     if response:
+      # With partial failure, failed operations get an empty response, so the
+      # responses keep the positions of the operations.
       for result in response.mutate_operation_responses:
         if result._pb.HasField("asset_result"):
           asset_resource_names.append(result.asset_result.resource_name)
+        else:
+          asset_resource_names.append(None)
       self.print_response_details(response)
 
     return asset_resource_names
@@ -545,7 +564,7 @@ class AdService:
                   asset_group.id ASC,
                   asset_group_asset.field_type ASC"""
 
-    return self._google_ads_client.get_service("GoogleAdsService").search(
+    return self._googleads_service.search(
         customer_id=customer_id, query=query
     )
 
@@ -580,7 +599,7 @@ class AdService:
                   AND campaign.status != 'REMOVED'
                   AND customer.status = 'ENABLED'"""
 
-    return self._google_ads_client.get_service("GoogleAdsService").search(
+    return self._googleads_service.search(
         customer_id=customer_id, query=query
     )
 
@@ -609,7 +628,7 @@ class AdService:
                   campaign.id ASC,
                   asset_group.id ASC"""
 
-    return self._google_ads_client.get_service("GoogleAdsService").search(
+    return self._googleads_service.search(
         customer_id=customer_id, query=query
     )
 
@@ -635,7 +654,7 @@ class AdService:
         ORDER BY
           campaign.id ASC"""
 
-    return self._google_ads_client.get_service("GoogleAdsService").search(
+    return self._googleads_service.search(
         customer_id=customer_id, query=query
     )
 
@@ -671,6 +690,6 @@ class AdService:
                 ORDER BY
                   customer.id ASC"""
 
-    return self._google_ads_client.get_service("GoogleAdsService").search(
+    return self._googleads_service.search(
         customer_id=login_customer_id, query=query
     )
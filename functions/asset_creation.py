@@ -13,9 +13,12 @@
 # limitations under the License.
 """Provides functionality to create assets in Google Ads."""
 
-from collections.abc import Mapping, MutableMapping, Sequence
+import collections
+from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from concurrent import futures
 from typing import Any, TypeAlias
 import uuid
+from absl import logging
 import ads_api
 import data_references
 from google.ads.googleads import client
@@ -24,6 +27,22 @@ from sheet_api import SheetsService
 import validators
 
 
+# Asset operations are paired with their asset group link operation, an even
+# batch size keeps each pair in the same request.
+_MAX_OPERATIONS_PER_REQUEST = 1000
+_MAX_CONCURRENT_CUSTOMERS = 4
+_MAX_CONCURRENT_DOWNLOADS = 8
+# Rows whose images are prefetched at once, bounds the image bytes held.
+_MAX_PREFETCHED_ASSETS = 64
+_IMAGE_ASSET_TYPES = frozenset((
+    data_references.AssetTypes.marketing_image,
+    data_references.AssetTypes.square_image,
+    data_references.AssetTypes.portrait_marketing_image,
+    data_references.AssetTypes.square_logo,
+    data_references.AssetTypes.landscape_logo,
+))
+
+
 class AssetService:
   """Class for Asset Creation.
 
@@ -52,6 +71,7 @@ class AssetService:
     self.sheet_service = sheet_service
 
     self.asset_temp_id = -10000
+    self._image_content = {}
 
   def process_asset_data_and_create(
       self,
@@ -70,19 +90,35 @@ class AssetService:
     # operations map contains separated by customer id operations
     # for Asset creation and linking of Assets to Asset Groups.
     # API allows bulk mutation only on the same customer id.
-    operations = {}
+    operations = collections.defaultdict(list)
     message_mapping = {}
     status_to_row_mapping = {}
-    for feedback_index, asset in enumerate(asset_data):
-      if (
-          asset[data_references.Assets.status]
-          != data_references.RowStatus.uploaded
-      ):
+    asset_group_index = self.sheet_service.get_sheet_index(
+        asset_group_data, data_references.SheetNames.asset_groups
+    )
+    pending_assets = [
+        (feedback_index, asset)
+        for feedback_index, asset in enumerate(asset_data)
+        if asset[data_references.Assets.status]
+        != data_references.RowStatus.uploaded
+    ]
+    # Prefetch the images per chunk of rows, only one chunk of downloaded
+    # images is held until its operations are built.
+    for start in range(0, len(pending_assets), _MAX_PREFETCHED_ASSETS):
+      pending_chunk = pending_assets[start : start + _MAX_PREFETCHED_ASSETS]
+      self.prefetch_images(
+          (
+              asset[data_references.Assets.type],
+              self.get_asset_value_by_type(
+                  asset, asset[data_references.Assets.type]
+              ),
+          )
+          for _, asset in pending_chunk
+      )
+      for feedback_index, asset in pending_chunk:
         asset_type = asset[data_references.Assets.type]
-        asset_group_details = self.sheet_service.get_sheet_row(
-            self.compile_asset_group_alias(asset),
-            asset_group_data,
-            data_references.SheetNames.asset_groups,
+        asset_group_details = asset_group_index.get(
+            self.compile_asset_group_alias(asset)
         )
         customer_id = asset_group_details[
             data_references.AssetGroupList.customer_id
@@ -104,15 +140,9 @@ class AssetService:
           status_to_row_mapping[feedback_index]["asset_group_asset"] = ""
 
         if asset_operation:
-          if (
-              customer_id not in operations.keys()
-              or not operations[customer_id]
-          ):
-            operations[customer_id] = []
-          operations[customer_id].append(asset_operation)
           resource_name = asset_operation.asset_operation.create.resource_name
-
-          operations[customer_id].append(
+          operations[customer_id].extend((
+              asset_operation,
               self.add_asset_to_asset_group(
                   resource_name,
                   asset_group_details[
@@ -120,12 +150,14 @@ class AssetService:
                   ],
                   asset_type,
                   customer_id,
-              )
-          )
+              ),
+          ))
 
           # map the index of the row to the resource that is process for allocating errors from the API call later
           message_mapping[resource_name] = feedback_index
 
+      self.clear_prefetched_images()
+
     self.upload_assets_to_sheet(
         operations, status_to_row_mapping, message_mapping
     )
@@ -145,30 +177,80 @@ class AssetService:
       message_mapping: Mapping of the resourse name and related row for
         uploading to the sheet.
     """
-    for customer_id in operations:
+    # Customers are independent of each other, upload them concurrently.
+    with futures.ThreadPoolExecutor(
+        max_workers=_MAX_CONCURRENT_CUSTOMERS
+    ) as executor:
+      customer_results = list(
+          executor.map(
+              lambda customer_id: self._mutate_customer_assets(
+                  customer_id, operations[customer_id], message_mapping
+              ),
+              operations,
+          )
+      )
+
+    error_messages = []
+    for results, error_message in customer_results:
+      if error_message:
+        error_messages.append(error_message)
+      status_to_row_mapping.update(results)
+
+    # The results of the assets created before a failure are written first,
+    # so those assets are not created again by the next run.
+    self.sheet_service.bulk_update_sheet_status(
+        data_references.SheetNames.assets,
+        data_references.Assets.status,
+        data_references.Assets.error_message,
+        data_references.Assets.asset_group_asset,
+        status_to_row_mapping,
+    )
+
+    if error_messages:
+      error_message = "\n".join(error_messages)
+      raise ValueError(f"Couldn't update Assets \n {error_message}")
+
+  def _mutate_customer_assets(
+      self,
+      customer_id: str,
+      customer_operations: Sequence[ads_api.AssetOperation],
+      message_mapping: Mapping[str, str],
+  ) -> tuple[Mapping[str, Mapping[str, str]], str | None]:
+    """Sends the asset operations of one customer in fixed size batches.
+
+    Args:
+      customer_id: Google Ads customer id.
+      customer_operations: List of operations from asset creation for the
+        customer, each asset followed by its asset group link.
+      message_mapping: Mapping of the resourse name and related row for
+        uploading to the sheet.
+
+    Returns:
+      A tuple of the mapping of the operation statuses and related rows, and
+      the error message of the first failed request, if any.
+    """
+    results = {}
+    for start in range(
+        0, len(customer_operations), _MAX_OPERATIONS_PER_REQUEST
+    ):
+      batch = customer_operations[start : start + _MAX_OPERATIONS_PER_REQUEST]
       response, error_message = self._google_ads_service.bulk_mutate(
-          operations[customer_id], customer_id, True
+          batch, customer_id, True
       )
       if error_message:
-        raise ValueError(f"Couldn't update Assets \n {error_message}")
+        return results, error_message
 
       if response:
-        status_to_row_mapping.update(
+        results.update(
             self._google_ads_service.process_asset_results(
                 response,
-                operations[customer_id],
+                batch,
                 message_mapping,
                 data_references.SheetNames.assets,
             )
         )
 
-    self.sheet_service.bulk_update_sheet_status(
-        data_references.SheetNames.assets,
-        data_references.Assets.status,
-        data_references.Assets.error_message,
-        data_references.Assets.asset_group_asset,
-        status_to_row_mapping,
-    )
+    return results, None
 
   def create_asset(
       self, asset_type: str, asset_value: str, customer_id: str
@@ -190,13 +272,7 @@ class AssetService:
         if not validators.url(asset_value) or not asset_value:
           raise ValueError(f"Asset URL {asset_value} is not a valid URL")
         mutate_operation = self.create_video_asset(asset_value, customer_id)
-      case asset_type if asset_type in [
-          data_references.AssetTypes.marketing_image,
-          data_references.AssetTypes.square_image,
-          data_references.AssetTypes.portrait_marketing_image,
-          data_references.AssetTypes.square_logo,
-          data_references.AssetTypes.landscape_logo,
-      ]:
+      case asset_type if asset_type in _IMAGE_ASSET_TYPES:
         if not validators.url(asset_value) or not asset_value:
           raise ValueError(f"Asset URL {asset_value} is not a valid URL")
         mutate_operation = self.create_image_asset(
@@ -251,6 +327,51 @@ class AssetService:
 
     return asset_operation
 
+  def prefetch_images(self, assets: Iterable[tuple[str, str]]) -> None:
+    """Downloads images concurrently ahead of creating their assets.
+
+    create_image_asset uses a prefetched image instead of downloading it.
+    Images that fail to download are left to create_image_asset. The caller
+    calls clear_prefetched_images once their operations are built.
+
+    Args:
+      assets: Tuples of asset type and asset value, only image assets with a
+        valid URL are downloaded.
+    """
+    image_urls = {
+        asset_value
+        for asset_type, asset_value in assets
+        if asset_type in _IMAGE_ASSET_TYPES
+        and asset_value
+        and validators.url(asset_value)
+    }
+    with futures.ThreadPoolExecutor(
+        max_workers=_MAX_CONCURRENT_DOWNLOADS
+    ) as executor:
+      download_results = executor.map(self._download_image, image_urls)
+      for image_url, image_content in zip(image_urls, download_results):
+        if image_content is not None:
+          self._image_content[image_url] = image_content
+
+  def clear_prefetched_images(self) -> None:
+    """Drops the prefetched images once their operations are built."""
+    self._image_content.clear()
+
+  def _download_image(self, image_url: str) -> bytes | None:
+    """Downloads an image.
+
+    Args:
+      image_url: Full url of the image file.
+
+    Returns:
+      The image content, or None if the download failed.
+    """
+    try:
+      return requests.get(image_url).content
+    except requests.RequestException as ex:
+      logging.warning("Unable to prefetch image %s: %s", image_url, str(ex))
+      return None
+
   def create_image_asset(
       self, image_url: str, name: str, customer_id: str
   ) -> ads_api.AssetOperation:
@@ -264,8 +385,12 @@ class AssetService:
     Returns:
       Asset operation or None.
     """
-    # Download image from URL and determine the ratio.
-    image_content = requests.get(image_url).content
+    # Download image from URL and determine the ratio, unless prefetched.
+    # Prefetched images are kept for rows sharing the URL until
+    # clear_prefetched_images is called.
+    image_content = self._image_content.get(image_url)
+    if image_content is None:
+      image_content = requests.get(image_url).content
 
     asset_service = self._google_ads_client.get_service("AssetService")
     resource_name = asset_service.asset_path(customer_id, self.asset_temp_id)
@@ -433,7 +558,7 @@ class AssetService:
 
   def compile_asset_group_alias(
       self, sheet_row: Sequence[str | int]
-  ) -> str | None:
+  ) -> tuple[str, str, str] | None:
     """Helper method to compile asset group alias from row content.
 
     Args:
@@ -441,7 +566,8 @@ class AssetService:
         spreadsheet.
 
     Returns:
-      String value of the asset group alias or None.
+      Tuple of the customer, campaign and asset group names, the key of the
+      asset group in the asset group list index, or None.
     """
     result = None
 
@@ -452,11 +578,9 @@ class AssetService:
         and sheet_row[data_references.Assets.asset_group_name].strip()
     ):
       result = (
-          sheet_row[data_references.Assets.customer_name]
-          + ";"
-          + sheet_row[data_references.Assets.campaign_name]
-          + ";"
-          + sheet_row[data_references.Assets.asset_group_name]
+          sheet_row[data_references.Assets.customer_name],
+          sheet_row[data_references.Assets.campaign_name],
+          sheet_row[data_references.Assets.asset_group_name],
       )
 
     return result
@@ -14,6 +14,8 @@
 """Provides functionality to create asset groups."""
 
 from collections.abc import Sequence
+from functools import cached_property
+from absl import logging
 import ads_api
 from asset_creation import AssetService
 import data_references
@@ -23,6 +25,21 @@ import utils
 import validators
 
 
+# Column ranges of the mandatory assets in the NewAssetGroups sheet.
+_HEADLINE_COLUMNS = slice(
+    data_references.newAssetGroupsColumnMap.HEADLINE1,
+    data_references.newAssetGroupsColumnMap.HEADLINE3 + 1,
+)
+_DESCRIPTION_COLUMNS = slice(
+    data_references.newAssetGroupsColumnMap.DESCRIPTION1,
+    data_references.newAssetGroupsColumnMap.DESCRIPTION2 + 1,
+)
+_OTHER_ASSET_COLUMNS = slice(
+    data_references.newAssetGroupsColumnMap.LONG_HEADLINE,
+    data_references.newAssetGroupsColumnMap.LOGO + 1,
+)
+
+
 class AssetGroupService:
   """Class for Campaign Creation.
 
@@ -53,7 +70,13 @@ class AssetGroupService:
     self.prev_image_asset_list = None
     self.prev_customer_id = None
     self.asset_group_temp_id = -1000
-    self.sheet_id = self.sheet_service.get_sheet_id("NewAssetGroups")
+
+  @cached_property
+  def sheet_id(self) -> str:
+    """Sheet id of the NewAssetGroups sheet, retrieved on first use."""
+    return self.sheet_service.get_sheet_id(
+        data_references.SheetNames.new_asset_groups
+    )
 
   def process_asset_group_data_and_create(
       self,
@@ -66,6 +89,9 @@ class AssetGroupService:
       asset_group_data: Actual data for creating new asset groups in array form.
       campaign_data: Campaign data from spreadsheet in array form.
     """
+    campaign_index = self.sheet_service.get_sheet_index(
+        campaign_data, data_references.SheetNames.campaigns
+    )
     for index, asset_group_row in enumerate(asset_group_data):
       if (
           asset_group_row[data_references.newAssetGroupsColumnMap.STATUS.value]
@@ -74,9 +100,7 @@ class AssetGroupService:
           > data_references.newAssetGroupsColumnMap.LOGO.value
       ):
         campaign_alias = self.compile_campaign_alias(asset_group_row)
-        campaign_details = self.sheet_service.get_sheet_row(
-            campaign_alias, campaign_data, data_references.SheetNames.campaigns
-        )
+        campaign_details = campaign_index.get(campaign_alias)
         asset_group_name = asset_group_row[
             data_references.newAssetGroupsColumnMap.ASSET_GROUP_NAME.value
         ]
@@ -168,15 +192,29 @@ class AssetGroupService:
         )
     )
 
-    # Create 3 mandatory headline assets, extend them to Bulk Operations Object.
-    headline_data = asset_group_row[
-        data_references.newAssetGroupsColumnMap.HEADLINE1.value : data_references.newAssetGroupsColumnMap.HEADLINE3.value
-        + 1
-    ]
-    headlines = self.create_mandatory_text_assets(
-        headline_data,
+    # Create the 3 mandatory headline and 2 mandatory description assets in a
+    # single request, and extend their assignment to the Bulk Operations Object.
+    headline_data = asset_group_row[_HEADLINE_COLUMNS]
+    descriptions = asset_group_row[_DESCRIPTION_COLUMNS]
+    text_resource_names = self.create_mandatory_text_assets(
+        headline_data + descriptions,
         customer_id,
     )
+    # Resource names keep the positions of the text assets, so only the text
+    # assets that failed are left out of the Asset Group.
+    headlines = [
+        resource_name
+        for resource_name in text_resource_names[: len(headline_data)]
+        if resource_name
+    ]
+    description_resource_names = [
+        resource_name
+        for resource_name in text_resource_names[len(headline_data) :]
+        if resource_name
+    ]
+    if None in text_resource_names:
+      logging.error("Unable to create all mandatory text assets.")
+
     operations.extend(
         self.consolidate_mandatory_assets_group_operations(
             headlines,
@@ -185,17 +223,6 @@ class AssetGroupService:
             customer_id,
         )
     )
-
-    # Create 2 mandatory description assets and extend them to Bulk
-    # Operations Object.
-    descriptions = asset_group_row[
-        data_references.newAssetGroupsColumnMap.DESCRIPTION1.value : data_references.newAssetGroupsColumnMap.DESCRIPTION2.value
-        + 1
-    ]
-    description_resource_names = self.create_mandatory_text_assets(
-        descriptions,
-        customer_id,
-    )
     operations.extend(
         self.consolidate_mandatory_assets_group_operations(
             description_resource_names,
@@ -211,10 +238,7 @@ class AssetGroupService:
     # in one and the same bulk operation.
     operations.extend(
         self.create_other_assets_asset_group(
-            asset_group_row[
-                data_references.newAssetGroupsColumnMap.LONG_HEADLINE.value : data_references.newAssetGroupsColumnMap.LOGO.value
-                + 1
-            ],
+            asset_group_row[_OTHER_ASSET_COLUMNS],
             asset_group_id,
             customer_id,
         )
@@ -243,13 +267,16 @@ class AssetGroupService:
       ARRAY of Assets and Asset Group : Google Ads API Operation objects.
     """
     operations = []
+    asset_types = [
+        data_references.newAssetGroupsColumnMap(
+            data_references.newAssetGroupsColumnMap.LONG_HEADLINE.value + index
+        ).name
+        for index in range(len(assets))
+    ]
+    # Download the images of the Asset Group concurrently.
+    self.asset_service.prefetch_images(zip(asset_types, assets))
 
-    for index, asset_value in enumerate(assets):
-      col_num = (
-          data_references.newAssetGroupsColumnMap.LONG_HEADLINE.value + index
-      )
-      asset_type = data_references.newAssetGroupsColumnMap(col_num).name
-
+    for asset_type, asset_value in zip(asset_types, assets):
       asset_operation = self.asset_service.create_asset(
           asset_type, asset_value, customer_id
       )
@@ -264,6 +291,7 @@ class AssetGroupService:
 
         operations.extend([asset_operation, asset_group_asset_operation])
 
+    self.asset_service.clear_prefetched_images()
     return operations
 
   def consolidate_mandatory_assets_group_operations(
@@ -301,7 +329,7 @@ class AssetGroupService:
 
   def create_mandatory_text_assets(
       self, text_assets: Sequence[str], customer_id: str
-  ) -> Sequence[str]:
+  ) -> Sequence[str | None]:
     """Logic to create mandatory text assets for asset group.
 
     When creating the API operations for a new Asset Group. The API expects
@@ -316,7 +344,8 @@ class AssetGroupService:
       customer_id: Google Ads customer id.
 
     Returns:
-      ARRAY of STRINGS, consisting of Google Ads Resource names.
+      ARRAY of STRINGS, consisting of Google Ads Resource names, one per text
+      asset, None for the text assets that could not be created.
     """
     operations = []
 
@@ -406,7 +435,7 @@ class AssetGroupService:
 
   def compile_campaign_alias(
       self, sheet_row: Sequence[str | int]
-  ) -> str | None:
+  ) -> tuple[str, str] | None:
     """Helper method to compile campaign alias from row content.
 
     Args:
@@ -414,7 +443,8 @@ class AssetGroupService:
         spreadsheet.
 
     Returns:
-      String value of the campaign alias or None.
+      Tuple of the customer and campaign names, the key of the campaign
+      in the campaign list index, or None.
     """
     result = None
 
@@ -423,9 +453,8 @@ class AssetGroupService:
         and sheet_row[data_references.Assets.campaign_name].strip()
     ):
       result = (
-          sheet_row[data_references.Assets.customer_name]
-          + ";"
-          + sheet_row[data_references.Assets.campaign_name]
+          sheet_row[data_references.Assets.customer_name],
+          sheet_row[data_references.Assets.campaign_name],
       )
 
     return result
@@ -20,7 +20,7 @@ import dataclasses
 import enum
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(frozen=True, slots=True)
 class ConfigFile:
   """Instance with mapping of the config file.
 
@@ -44,7 +44,7 @@ class ConfigFile:
   client_secret: str
   access_token: str
   refresh_token: str
-  login_customer_id: int
+  login_customer_id: str
   customer_id_inclusion_list: str
   spreadsheet_id: str
 
@@ -22,6 +22,9 @@ import requests
 
 # The format of Drive URL
 _DRIVE_URL = "drive.google.com"
+# Retries of requests failing with 429 or 5xx, with randomized exponential
+# backoff.
+_NUM_RETRIES = 5
 
 
 class DriveService:
@@ -73,7 +76,7 @@ class DriveService:
                 fields="nextPageToken, files(id)",
                 pageToken=page_token,
             )
-            .execute()
+            .execute(num_retries=_NUM_RETRIES)
         )
         for file in response.get("files", []):
           file_id = file.get("id")
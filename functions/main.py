@@ -14,7 +14,11 @@
 """Main trigger, Used to run the mad pMax Creative Management tools."""
 
 import base64
+import dataclasses
+import functools
+from collections.abc import Mapping
 from typing import Final
+import auth
 from cloudevents.http import CloudEvent
 import functions_framework
 from google.ads.googleads import client
@@ -25,6 +29,9 @@ import yaml
 
 _CONFIG_FILE_NAME: Final[str] = "config.yaml"
 _API_VERSIONAPI_VERSION: Final[str] = "v16"
+# The libyaml based loader is much faster, fall back to the pure Python one if
+# PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def retrieve_config(config_name: str) -> ConfigFile:
@@ -38,11 +45,67 @@ def retrieve_config(config_name: str) -> ConfigFile:
   """
   try:
     with open(config_name, "r") as config_file:
-      return ConfigFile(**yaml.safe_load(config_file))
+      return ConfigFile(**yaml.load(config_file, Loader=_YAML_LOADER))
   except (ValueError, TypeError) as ex:
     raise TypeError("Wrong structure or type of config file.", ex)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_config() -> ConfigFile:
+  """Loads the config file once per container instance.
+
+  Cloud Functions reuse the container between invocations, caching the parsed
+  config keeps file I/O and YAML parsing off the warm request path.
+
+  Returns:
+      ConfigFile object representing JSON structure of config file.
+  """
+  return retrieve_config(_CONFIG_FILE_NAME)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_google_ads_client() -> client.GoogleAdsClient:
+  """Builds the Google Ads client once per container instance.
+
+  Returns:
+      Google Ads API client shared by all invocations of this container.
+  """
+  return client.GoogleAdsClient.load_from_dict(
+      dataclasses.asdict(_load_config()), version=_API_VERSIONAPI_VERSION
+  )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_credentials() -> Mapping[str, str]:
+  """Builds the OAuth credentials once per container instance.
+
+  Returns:
+      OAuth credentials shared by all invocations of this container.
+  """
+  config = _load_config()
+  return auth.get_credentials_from_file(
+      config.access_token,
+      config.refresh_token,
+      config.client_id,
+      config.client_secret,
+  )
+
+
+def _get_pubsub() -> pubsub.PubSub:
+  """Builds the PubSub handler of one invocation.
+
+  Only the stateless config, Google Ads client and credentials are shared
+  between warm invocations. The services, with their queued writes, read
+  caches and temporary id counters, start fresh for every message.
+
+  Returns:
+      PubSub instance for the current invocation.
+  """
+  return pubsub.PubSub(
+      _load_config(), _get_google_ads_client(), _get_credentials()
+  )
+
+
 @functions_framework.cloud_event
 def pmax_trigger(cloud_event: CloudEvent) -> None:
   """Listener function for pubsub trigger.
@@ -53,20 +116,12 @@ def pmax_trigger(cloud_event: CloudEvent) -> None:
   Args:
     cloud_event: Cloud event class for pubsub event.
   """
-  google_ads_client = client.GoogleAdsClient.load_from_storage(
-      _CONFIG_FILE_NAME, version=_API_VERSIONAPI_VERSION
-  )
-  config = retrieve_config(_CONFIG_FILE_NAME)
-  pubsub_utils = pubsub.PubSub(config, google_ads_client)
+  pubsub_utils = _get_pubsub()
   if cloud_event:
-    logging.info(
-        "------- START "
-        + base64.b64decode(cloud_event.data["message"]["data"]).decode()
-        + " EXECUTION -------"
-    )
     message_data = base64.b64decode(
         cloud_event.data["message"]["data"]
     ).decode()
+    logging.info("------- START %s EXECUTION -------", message_data)
     match message_data:
       case "REFRESH":
         pubsub_utils.refresh_spreadsheet()
@@ -83,8 +138,4 @@ def pmax_trigger(cloud_event: CloudEvent) -> None:
       case "REFRESH_SITELINKS":
         pubsub_utils.refresh_sitelinks_list()
 
-    logging.info(
-        "------- END "
-        + base64.b64decode(cloud_event.data["message"]["data"]).decode()
-        + " EXECUTION -------"
-    )
+    logging.info("------- END %s EXECUTION -------", message_data)
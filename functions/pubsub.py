@@ -13,6 +13,8 @@
 # limitations under the License.
 """Main function, Used to run the mad pMax Creative Management tools."""
 
+from collections.abc import Mapping
+from concurrent import futures
 from functools import cached_property
 from absl import logging
 import ads_api
@@ -25,6 +27,38 @@ from google.ads.googleads import client
 import sheet_api
 import sitelink_creation
 
+# Input ranges read on every run, built once at import time.
+_NEW_CAMPAIGNS_RANGE = (
+    data_references.SheetNames.new_campaigns
+    + "!"
+    + data_references.SheetRanges.new_campaigns
+)
+_SITELINKS_RANGE = (
+    data_references.SheetNames.sitelinks
+    + "!"
+    + data_references.SheetRanges.sitelinks
+)
+_ASSETS_RANGE = (
+    data_references.SheetNames.assets
+    + "!"
+    + data_references.SheetRanges.assets
+)
+_NEW_ASSET_GROUPS_RANGE = (
+    data_references.SheetNames.new_asset_groups
+    + "!"
+    + data_references.SheetRanges.new_asset_groups
+)
+_ASSET_GROUPS_RANGE = (
+    data_references.SheetNames.asset_groups
+    + "!"
+    + data_references.SheetRanges.asset_groups
+)
+_CAMPAIGNS_RANGE = (
+    data_references.SheetNames.campaigns
+    + "!"
+    + data_references.SheetRanges.campaigns
+)
+
 
 class PubSub:
   """Main function to call update and refresh for spreadsheet functionality."""
@@ -32,22 +66,27 @@ class PubSub:
   def __init__(
       self,
       config: data_references.ConfigFile,
-      google_ads_client: client.GoogleAdsClient
+      google_ads_client: client.GoogleAdsClient,
+      credentials: Mapping[str, str] | None = None,
   ) -> None:
     """Constructs the PubSub instance.
 
     Args:
         config: JSON formatted configuration data for accessing API.
         google_ads_client: Instance of Google Ads API client.
+        credentials: OAuth credentials, built from the config if None.
 
     Returns:
         None. Initiates instances during the call.
     """
     self.config = config
     self.google_ads_client = google_ads_client
+    self._credentials = credentials
 
   @cached_property
   def credentials(self):
+    if self._credentials is not None:
+      return self._credentials
     return auth.get_credentials_from_file(
         self.config.access_token,
         self.config.refresh_token,
@@ -126,59 +165,67 @@ class PubSub:
     For the assets provided. Removes the provided placeholder assets, and
     writes the results back to the spreadsheet.
     """
-    logging.info("Processing NewCampaigns data")
-    new_campaign_data = self.sheet_service.get_sheet_values(
-        data_references.SheetNames.new_campaigns
-        + "!"
-        + data_references.SheetRanges.new_campaigns
-    )
-    logging.info("Processing Sitelink data")
-    sitelink_data = self.sheet_service.get_sheet_values(
-        data_references.SheetNames.sitelinks
-        + "!"
-        + data_references.SheetRanges.sitelinks
-    )
-    logging.info("Processing Assets data")
-    asset_data = self.sheet_service.get_sheet_values(
-        data_references.SheetNames.assets
-        + "!"
-        + data_references.SheetRanges.assets
-    )
-    logging.info("Processing New Asset Groups data")
-    new_asset_group_data = self.sheet_service.get_sheet_values(
-        data_references.SheetNames.new_asset_groups
-        + "!"
-        + data_references.SheetRanges.new_asset_groups
-    )
-    logging.info("Processing Asset Groups data")
-    asset_group_data = self.sheet_service.get_sheet_values(
-        data_references.SheetNames.asset_groups
-        + "!"
-        + data_references.SheetRanges.asset_groups
-    )
-    logging.info("Processing Campaign data")
-    campaign_data = self.sheet_service.get_sheet_values(
-        data_references.SheetNames.campaigns
-        + "!"
-        + data_references.SheetRanges.campaigns
-    )
-
-    if new_campaign_data:
-      logging.info("Creating new Campaigns")
-      self.campaign_service.process_campaign_input_sheet(new_campaign_data)
-
-    if new_asset_group_data and campaign_data:
-      logging.info("Creating new Asset Groups")
-      self.asset_group_service.process_asset_group_data_and_create(
-          new_asset_group_data, campaign_data
-      )
-
-    if asset_data and asset_group_data:
-      logging.info("Creating Assets")
-      self.asset_service.process_asset_data_and_create(
-          asset_data, asset_group_data
-      )
-
-    if sitelink_data and campaign_data:
-      logging.info("Creating new Sitelinks")
-      self.sitelink_service.process_sitelink_input_sheet(sitelink_data)
+    # Customer and campaign lists are looked up for every input row, serve
+    # repeated reads from memory for the duration of this run.
+    with self.sheet_service.cached_reads():
+      logging.info("Retrieving input sheet data")
+      sheet_values = self.sheet_service.batch_get_sheet_values([
+          _NEW_CAMPAIGNS_RANGE,
+          _SITELINKS_RANGE,
+          _ASSETS_RANGE,
+          _NEW_ASSET_GROUPS_RANGE,
+          _ASSET_GROUPS_RANGE,
+          _CAMPAIGNS_RANGE,
+      ])
+      new_campaign_data = sheet_values[_NEW_CAMPAIGNS_RANGE]
+      sitelink_data = sheet_values[_SITELINKS_RANGE]
+      asset_data = sheet_values[_ASSETS_RANGE]
+      new_asset_group_data = sheet_values[_NEW_ASSET_GROUPS_RANGE]
+      asset_group_data = sheet_values[_ASSET_GROUPS_RANGE]
+      campaign_data = sheet_values[_CAMPAIGNS_RANGE]
+
+      if not (
+          new_campaign_data
+          or new_asset_group_data
+          or asset_data
+          or sitelink_data
+      ):
+        logging.info("No input rows to process")
+        return
+
+      # Status updates are queued by the services and written in one request.
+      try:
+        # Sitelinks only depend on the campaign list read above, so they are
+        # created in the background while the campaigns, asset groups and
+        # assets are processed.
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+          sitelink_future = None
+          if sitelink_data and campaign_data:
+            logging.info("Creating new Sitelinks")
+            sitelink_future = executor.submit(
+                self.sitelink_service.process_sitelink_input_sheet,
+                sitelink_data,
+            )
+
+          if new_campaign_data:
+            logging.info("Creating new Campaigns")
+            self.campaign_service.process_campaign_input_sheet(
+                new_campaign_data
+            )
+
+          if new_asset_group_data and campaign_data:
+            logging.info("Creating new Asset Groups")
+            self.asset_group_service.process_asset_group_data_and_create(
+                new_asset_group_data, campaign_data
+            )
+
+          if asset_data and asset_group_data:
+            logging.info("Creating Assets")
+            self.asset_service.process_asset_data_and_create(
+                asset_data, asset_group_data
+            )
+
+          if sitelink_future:
+            sitelink_future.result()
+      finally:
+        self.sheet_service.flush_update_requests()
@@ -13,24 +13,356 @@
 # limitations under the License.
 """Provides Google Sheets API to read and write sheets."""
 
-from collections.abc import Mapping, MutableMapping, Sequence
+import collections
+from collections.abc import (
+    Callable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from concurrent import futures
+import contextlib
+import functools
+import itertools
+import queue
 import re
-from typing import TypeAlias
+from typing import Any, TypeAlias
 from absl import logging
 import ads_api
 import data_references
 from google.ads.googleads import client
+import google_auth_httplib2
 from googleapiclient import discovery
 from googleapiclient import errors
+from googleapiclient import http as http_lib
+import httplib2
 import yaml
 
 _SHEET_HEADER_SIZE = 5
+# The libyaml based loader is much faster, fall back to the pure Python one if
+# PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Retries of requests failing with 429 or 5xx, with randomized exponential
+# backoff (up to 2**n seconds before the n-th retry), so a read or write quota
+# hit delays the run instead of failing it.
+_NUM_RETRIES = 5
+# HTTP status of batch updates rejected for their size, which are retried in
+# smaller parts.
+_PAYLOAD_TOO_LARGE = 413
+# Formula listing the customers of the dropdowns, in cell N3 of the dropdown
+# configuration sheet.
+_DROPDOWN_CONFIG_SHEET = "DropDownConfig"
+_CUSTOMER_DROPDOWN_FORMULA = "=SORT(UNIQUE({CustomerList!$A$5:$A}))"
+_CUSTOMER_DROPDOWN_ROW = 2
+_CUSTOMER_DROPDOWN_COLUMN = 13
+# Concurrent Google Ads queries when refreshing the sheets of all customers.
+# The queries only wait on the network, so threads overlap their latency.
+_ADS_MAX_WORKERS = 16
+# Row number at the end of an A1 range, e.g. 10 in "Assets!A5:L10".
+_TABLE_RANGE_END_ROW = re.compile(r"(\d+)$")
+# Columns holding the ids of the rows already in the list sheets.
+_CUSTOMER_IDS_RANGE = data_references.SheetNames.customers + "!B:B"
+_CAMPAIGN_IDS_RANGE = data_references.SheetNames.campaigns + "!D:D"
+_ASSET_GROUP_IDS_RANGE = data_references.SheetNames.asset_groups + "!F:F"
+# Columns holding the resource names of the rows already in the sheet.
+_ASSET_RESOURCE_RANGE = data_references.SheetNames.assets + "!L:L"
+_SITELINK_RESOURCE_RANGE = data_references.SheetNames.sitelinks + "!J:J"
 _RequestNote: TypeAlias = Mapping[
     str, Mapping[str, str | int | Sequence | Mapping[str, str]]
 ]
 _CheckboxCell: TypeAlias = Mapping[str, Mapping[str, str] | Sequence]
 _DropdownCell: TypeAlias = Mapping[str, str | int | bool | Mapping[str, str]]
-_Thumbnail: TypeAlias = Mapping[str, str | Sequence | Mapping[str, str]]
+
+# Cell content of checkboxes, shared by all checkbox requests since requests
+# are only serialized, never modified.
+_CHECKBOX_CELL = {"dataValidation": {"condition": {"type": "BOOLEAN"}}}
+
+# Asset types whose sheet rows show the text or the image of the asset.
+_TEXT_ASSET_TYPES = frozenset((
+    data_references.AssetTypes.headline,
+    data_references.AssetTypes.description,
+    data_references.AssetTypes.long_headline,
+    data_references.AssetTypes.business_name,
+))
+_IMAGE_ASSET_TYPES = frozenset((
+    data_references.AssetTypes.marketing_image,
+    data_references.AssetTypes.square_image,
+    data_references.AssetTypes.portrait_marketing_image,
+    data_references.AssetTypes.square_logo,
+    data_references.AssetTypes.landscape_logo,
+))
+
+# Columns that together form the unique key of a row, per sheet.
+_SHEET_ROW_KEY_COLUMNS: Mapping[str, Sequence[int]] = {
+    data_references.SheetNames.customers: (
+        data_references.CustomerList.customer_name,
+    ),
+    data_references.SheetNames.campaigns: (
+        data_references.CampaignList.customer_name,
+        data_references.CampaignList.campaign_name,
+    ),
+    data_references.SheetNames.new_campaigns: (
+        data_references.NewCampaigns.customer_name,
+        data_references.NewCampaigns.campaign_name,
+    ),
+    data_references.SheetNames.asset_groups: (
+        data_references.AssetGroupList.customer_name,
+        data_references.AssetGroupList.campaign_name,
+        data_references.AssetGroupList.asset_group_name,
+    ),
+    data_references.SheetNames.new_asset_groups: (
+        data_references.newAssetGroupsColumnMap.CUSTOMER_NAME.value,
+        data_references.newAssetGroupsColumnMap.CAMPAIGN_NAME.value,
+        data_references.newAssetGroupsColumnMap.ASSET_GROUP_NAME.value,
+    ),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> Mapping[str, str]:
+  """Loads the config file once per process.
+
+  Returns:
+    Mapping of the config file keys to their values.
+  """
+  with open("config.yaml", "r") as ymlfile:
+    return yaml.load(ymlfile, Loader=_YAML_LOADER)
+
+
+def _split_into_runs(indexes: Sequence[int]) -> Sequence[Sequence[int]]:
+  """Splits sorted indexes into runs of consecutive indexes.
+
+  Args:
+    indexes: Sorted array of unique indexes.
+
+  Returns:
+    Array of runs, for example [[1, 2, 3], [5], [7, 8]] for [1, 2, 3, 5, 7, 8].
+  """
+  runs = []
+  for index in indexes:
+    if runs and runs[-1][-1] + 1 == index:
+      runs[-1].append(index)
+    else:
+      runs.append([index])
+  return runs
+
+
+def _group_consecutive(
+    keys: Sequence[str | tuple[str, ...]],
+) -> Iterator[tuple[str | tuple[str, ...], int, int]]:
+  """Groups runs of consecutive equal keys.
+
+  Args:
+    keys: Array of keys, one per row.
+
+  Yields:
+    Tuples (key, index of the first row of the run, number of rows in the run),
+    for example ("a", 0, 2), ("b", 2, 1) for ["a", "a", "b"].
+  """
+  index = 0
+  for key, run in itertools.groupby(keys):
+    count = len(list(run))
+    yield key, index, count
+    index += count
+
+
+def _merge_cell_updates(
+    requests: Sequence[Mapping[str, Any]],
+) -> list[Mapping[str, Any]]:
+  """Merges single cell updates of consecutive rows of a column.
+
+  Single cell updateCells requests of the same sheet column are replaced by
+  one updateCells request per run of consecutive rows. Any other request
+  ends the merged runs, so the requests keep their relative order.
+
+  Args:
+    requests: Array of batch update requests.
+
+  Returns:
+    Array of batch update requests, for example one request writing rows 5
+    to 7 of a column for three requests writing a cell of rows 5, 6 and 7.
+  """
+  merged_requests = []
+  # Cell rows by (sheet id, column index, fields), then by row index.
+  columns = {}
+
+  def add_merged_requests() -> None:
+    for (sheet_id, col_index, fields), rows in columns.items():
+      for run in _split_into_runs(sorted(rows)):
+        merged_requests.append({
+            "updateCells": {
+                "start": {
+                    "sheetId": sheet_id,
+                    "rowIndex": run[0],
+                    "columnIndex": col_index,
+                },
+                "rows": [rows[row_index] for row_index in run],
+                "fields": fields,
+            }
+        })
+    columns.clear()
+
+  for request in requests:
+    update_cells = request.get("updateCells")
+    if (
+        update_cells
+        and "start" in update_cells
+        and len(update_cells["rows"]) == 1
+        and len(update_cells["rows"][0].get("values", [])) == 1
+    ):
+      start = update_cells["start"]
+      key = (start["sheetId"], start["columnIndex"], update_cells["fields"])
+      # A later write of the same cell replaces the earlier one.
+      columns.setdefault(key, {})[start["rowIndex"]] = update_cells["rows"][0]
+    else:
+      add_merged_requests()
+      merged_requests.append(request)
+  add_merged_requests()
+  return merged_requests
+
+
+def _get_range_sheet_name(cell_range: str) -> str:
+  """Extracts the sheet name of an A1 range.
+
+  Args:
+    cell_range: String representation of sheet range, for example
+      "'Sheet name'!A1:C10" as returned by the API, or "Sheet name!A:C".
+
+  Returns:
+    The unquoted sheet name, for example "Sheet name".
+  """
+  sheet_name = cell_range.rsplit("!", 1)[0]
+  if len(sheet_name) > 1 and sheet_name[0] == sheet_name[-1] == "'":
+    sheet_name = sheet_name[1:-1].replace("''", "'")
+  return sheet_name
+
+
+def _map_ahead(
+    executor: futures.Executor,
+    function: Callable[[str], Any],
+    items: Sequence[str],
+) -> Iterator[Any]:
+  """Maps a function over items in an executor, a bounded number ahead.
+
+  Unlike Executor.map, which submits all items at once and keeps every
+  result until it is consumed, at most _ADS_MAX_WORKERS results are computed
+  ahead of the consumer, so the results of all customers are never held in
+  memory at the same time.
+
+  Args:
+    executor: Executor running the function.
+    function: Function to call with each item.
+    items: Items to call the function with.
+
+  Yields:
+    The results of the function, in the order of the items.
+  """
+  pending = collections.deque()
+  for item in items:
+    pending.append(executor.submit(function, item))
+    if len(pending) >= _ADS_MAX_WORKERS:
+      yield pending.popleft().result()
+  while pending:
+    yield pending.popleft().result()
+
+
+def _get_customer_ids(results: ads_api.ApiResponse) -> Sequence[str]:
+  """Collects the ids of the customers of a customer query.
+
+  Args:
+    results: Google Ads API search results of customer clients.
+
+  Returns:
+    The customer ids as strings, in the order of the results.
+  """
+  # Search requests take the customer id as a string.
+  return [str(row.customer_client.id) for row in results]
+
+
+def _add_customer_to_account_map(
+    row: ads_api.ApiResponse,
+    account_map: MutableMapping[str, MutableMapping[str, Sequence[str]]],
+) -> str:
+  """Adds the customer of a customer list row to the account map.
+
+  Args:
+    row: Google Ads API search result row of a customer client.
+    account_map: Google Ads account map, account ids and names.
+
+  Returns:
+    The customer id, which identifies the row in the customer list.
+  """
+  account_map.setdefault(row.customer_client.descriptive_name, {})
+  return str(row.customer_client.id)
+
+
+def _add_campaign_to_account_map(
+    row: ads_api.ApiResponse,
+    account_map: MutableMapping[str, MutableMapping[str, Sequence[str]]],
+) -> str:
+  """Adds the campaign of a campaign list row to the account map.
+
+  Args:
+    row: Google Ads API search result row of a campaign.
+    account_map: Google Ads account map, account ids and names.
+
+  Returns:
+    The campaign id, which identifies the row in the campaign list.
+  """
+  account_map[row.customer.descriptive_name].setdefault(row.campaign.name, [])
+  return str(row.campaign.id)
+
+
+def _add_asset_group_to_account_map(
+    row: ads_api.ApiResponse,
+    account_map: MutableMapping[str, MutableMapping[str, Sequence[str]]],
+) -> str:
+  """Adds the asset group of an asset group list row to the account map.
+
+  Args:
+    row: Google Ads API search result row of an asset group.
+    account_map: Google Ads account map, account ids and names.
+
+  Returns:
+    The asset group id, which identifies the row in the asset group list.
+  """
+  asset_groups = account_map[row.customer.descriptive_name][row.campaign.name]
+  if row.asset_group.name not in asset_groups:
+    asset_groups.append(row.asset_group.name)
+  return str(row.asset_group.id)
+
+
+# Account map update and sheet range of the rows, per list sheet.
+_SHEET_LIST_HANDLERS: Mapping[str, tuple[Callable[..., str], str]] = {
+    data_references.SheetNames.customers: (
+        _add_customer_to_account_map,
+        data_references.SheetRanges.customers,
+    ),
+    data_references.SheetNames.campaigns: (
+        _add_campaign_to_account_map,
+        data_references.SheetRanges.campaigns,
+    ),
+    data_references.SheetNames.asset_groups: (
+        _add_asset_group_to_account_map,
+        data_references.SheetRanges.asset_groups,
+    ),
+}
+
+
+def _get_column_values(
+    values: Sequence[Sequence[str | int]],
+) -> set[str]:
+  """Collects the values of a single column range.
+
+  Args:
+    values: Array of arrays of values of the column, like the resource names
+      or the ids of a list.
+
+  Returns:
+    The values in the column, without empty cells.
+  """
+  return {value[0] for value in values if value}
 
 
 class SheetsService:
@@ -44,6 +376,16 @@ class SheetsService:
     google_ads_client: Google Ads API client.
     google_ads_service: Google Ads method class.
     _sheets_service: Google Sheets API method class.
+    _credentials: API OAuth credentials object.
+    _http_pool: Pool of idle authorized HTTP transports for sheet requests.
+    _pending_requests: Cell update requests queued until the next flush.
+    _pending_rows: Rows to append queued until the next flush, by sheet range.
+    _pending_outputs: Rows to append whose custom columns are set after the
+        append, with the column update method and account map, by sheet range.
+    _pending_sorts: Sort requests sent after the queued updates, by sheet id.
+    _values_cache: Sheet values read so far, by range, while reads are cached.
+    _index_cache: Row indexes of the cached sheet values, by range.
+    _sheet_ids: Sheet ids of the spreadsheet by sheet name, once fetched.
   """
 
   def __init__(
@@ -59,18 +401,103 @@ class SheetsService:
       google_ads_client: Google Ads API client.
       google_ads_service: Google Ads method class.
     """
-    with open("config.yaml", "r") as ymlfile:
-      cfg = yaml.safe_load(ymlfile)
-
+    cfg = _load_config()
     self.spread_sheet_id = cfg["spreadsheet_id"]
     self.customer_id_inclusion_list = cfg["customer_id_inclusion_list"]
     self.login_customer_id = cfg["login_customer_id"]
     self.google_ads_service = google_ads_service
     self.google_ads_client = google_ads_client
+    self._credentials = credentials
+    self._http_pool = queue.SimpleQueue()
+    self._pending_requests = []
+    self._pending_rows = {}
+    self._pending_outputs = {}
+    self._pending_sorts = {}
+    self._values_cache = None
+    self._index_cache = {}
+    self._sheet_ids = {}
     self._sheets_service = discovery.build(
         "sheets", "v4", credentials=credentials
     ).spreadsheets()
 
+  @contextlib.contextmanager
+  def _borrow_http(self) -> Iterator[google_auth_httplib2.AuthorizedHttp]:
+    """Lends an authorized HTTP transport from the pool to the caller.
+
+    httplib2 connections are not thread safe, so each concurrent request gets
+    its own transport. Transports are returned to the pool afterwards, so
+    their open connections are kept alive and reused by later requests.
+
+    Yields:
+      Authorized HTTP transport for exclusive use by the caller.
+    """
+    try:
+      http = self._http_pool.get_nowait()
+    except queue.Empty:
+      http = google_auth_httplib2.AuthorizedHttp(
+          self._credentials, http=httplib2.Http()
+      )
+    try:
+      yield http
+    finally:
+      self._http_pool.put(http)
+
+  def _execute(self, request: http_lib.HttpRequest) -> Mapping[str, Any]:
+    """Executes a request on a pooled transport, retrying rate limits.
+
+    Args:
+      request: The Sheets API request to execute.
+
+    Returns:
+      The response of the request.
+    """
+    with self._borrow_http() as http:
+      return request.execute(http=http, num_retries=_NUM_RETRIES)
+
+  @contextlib.contextmanager
+  def cached_reads(self) -> Iterator[None]:
+    """Caches sheet values read within the context.
+
+    Repeated reads of the same range, for example the customer and campaign
+    lists looked up for every input row, are served from memory. Writes made
+    through this service invalidate the affected entries. The cache is
+    dropped when the context exits, so changes made to the spreadsheet by
+    users are picked up by the next invocation. Nested contexts share the
+    cache of the outermost one.
+
+    Yields:
+      None.
+    """
+    if self._values_cache is not None:
+      yield
+      return
+
+    self._values_cache = {}
+    try:
+      yield
+    finally:
+      self._values_cache = None
+      self._index_cache = {}
+
+  def invalidate_range(self, cell_range: str | None = None) -> None:
+    """Drops cached values of a sheet, or of all sheets.
+
+    Args:
+      cell_range: String representation of the written sheet range. Cached
+        ranges of the same sheet are dropped. If None, the whole cache is
+        dropped.
+    """
+    if not self._values_cache:
+      return
+    if cell_range is None:
+      self._values_cache.clear()
+      return
+
+    sheet_name = cell_range.partition("!")[0]
+    for cached_range in list(self._values_cache):
+      if cached_range.partition("!")[0] == sheet_name:
+        del self._values_cache[cached_range]
+
   def get_sheet_values(self, cell_range: str) -> Sequence[Sequence[str | int]]:
     """Retrieves values from sheet.
 
@@ -81,123 +508,355 @@ class SheetsService:
     Returns:
       Array of arrays of values in selectd field range.
     """
-    result = (
-        self._sheets_service.values()
-        .get(spreadsheetId=self.spread_sheet_id, range=cell_range)
-        .execute()
+    if self._values_cache is not None and cell_range in self._values_cache:
+      return self._values_cache[cell_range]
+
+    result = self._execute(
+        self._sheets_service.values().get(
+            spreadsheetId=self.spread_sheet_id,
+            range=cell_range,
+            fields="values",
+        )
     )
-    return result.get("values", [])
+    values = result.get("values", [])
+    if self._values_cache is not None:
+      self._values_cache[cell_range] = values
+    return values
+
+  def batch_get_sheet_values(
+      self, cell_ranges: Sequence[str]
+  ) -> Mapping[str, Sequence[Sequence[str | int]]]:
+    """Retrieves values of several sheet ranges in a single request.
 
-  def _set_cell_value(self, value: str, cell_range: str) -> None:
-    """Sets Cell value on sheet.
+    While reads are cached, only the ranges missing from the cache are
+    requested.
 
     Args:
-      value: The string value as input for the cell.
-      cell_range: String representation of cell range. For example,
-        "sheet_name!B2".
+      cell_ranges: String representations of sheet ranges. For example,
+        ["sheet_name!A:C", "other_sheet_name!A:B"].
+
+    Returns:
+      Mapping of each requested range to the array of arrays of values in it.
+
+    Raises:
+      ValueError: If the returned value ranges do not match the requested
+        ranges.
     """
-    value_range_body = {"range": cell_range, "values": [[value]]}
-    request = self._sheets_service.values().update(
-        spreadsheetId=self.spread_sheet_id,
-        valueInputOption="USER_ENTERED",
-        range=cell_range,
-        body=value_range_body,
-    )
-    request.execute()
+    values_cache = self._values_cache
+    if values_cache is None:
+      values_cache = {}
+    missing_ranges = [
+        cell_range for cell_range in cell_ranges
+        if cell_range not in values_cache
+    ]
+    if missing_ranges:
+      result = self._execute(
+          self._sheets_service.values().batchGet(
+              spreadsheetId=self.spread_sheet_id,
+              ranges=missing_ranges,
+              fields="valueRanges(range,values)",
+          )
+      )
+      # Value ranges are returned in the order of the requested ranges, with
+      # the returned ranges normalized, e.g. "'Sheet'!A1:C10" for "Sheet!A:C".
+      value_ranges = result.get("valueRanges", [])
+      if len(value_ranges) != len(missing_ranges) or any(
+          _get_range_sheet_name(cell_range)
+          != _get_range_sheet_name(value_range.get("range", ""))
+          for cell_range, value_range in zip(missing_ranges, value_ranges)
+      ):
+        raise ValueError(
+            f"Value ranges {[r.get('range') for r in value_ranges]} do not"
+            f" match the requested ranges {missing_ranges}."
+        )
+      values_cache.update(
+          (cell_range, value_range.get("values", []))
+          for cell_range, value_range in zip(missing_ranges, value_ranges)
+      )
+    return {cell_range: values_cache[cell_range] for cell_range in cell_ranges}
+
+  def queue_customer_dropdown_update(self) -> None:
+    """Queues the formula listing the customers of the dropdowns.
+
+    The cell is written by flush_update_requests, together with the other
+    updates of the refresh.
+    """
+    sheet_id = self.get_sheet_id(_DROPDOWN_CONFIG_SHEET)
+    self.queue_update_requests([{
+        "updateCells": {
+            "start": {
+                "sheetId": sheet_id,
+                "rowIndex": _CUSTOMER_DROPDOWN_ROW,
+                "columnIndex": _CUSTOMER_DROPDOWN_COLUMN,
+            },
+            "rows": [{
+                "values": [{
+                    "userEnteredValue": {
+                        "formulaValue": _CUSTOMER_DROPDOWN_FORMULA
+                    }
+                }]
+            }],
+            "fields": "userEnteredValue",
+        }
+    }])
 
   def get_sheet_row(
       self,
-      key: str,
+      key: str | tuple[str, ...],
       sheet_values: Sequence[Sequence[str | int]],
       sheet_name: str,
   ) -> Sequence[str | int]:
     """Returns the values of the sheet row matching the alias.
 
     Args:
-      key: The string value of the unique key for the row.
+      key: The unique key for the row, as compiled by _get_sheet_row_key.
       sheet_values: Array of arrays representation of sheet_name.
       sheet_name: Enum input with type from Sheets Enum.
 
     Returns:
       Array of row values, or None.
     """
-    result = None
-    row_key = None
+    for row in sheet_values:
+      if self._get_sheet_row_key(row, sheet_name) == key:
+        return row
+
+    return None
+
+  def get_sheet_index(
+      self,
+      sheet_values: Sequence[Sequence[str | int]],
+      sheet_name: str,
+  ) -> Mapping[str | tuple[str, ...], Sequence[str | int]]:
+    """Indexes the sheet rows by their unique key.
+
+    Use this instead of repeated get_sheet_row calls when looking up many keys
+    in the same sheet, so the sheet is scanned only once.
+
+    Args:
+      sheet_values: Array of arrays representation of sheet_name.
+      sheet_name: Enum input with type from Sheets Enum.
 
+    Returns:
+      Mapping of row key to row values. If a key appears more than once, the
+      first matching row is kept, as in get_sheet_row.
+    """
+    index = {}
     for row in sheet_values:
-      if sheet_name == data_references.SheetNames.customers:
-        row_key = row[data_references.CustomerList.customer_name]
-      if sheet_name == data_references.SheetNames.campaigns:
-        row_key = (
-            row[data_references.CampaignList.customer_name]
-            + ";"
-            + row[data_references.CampaignList.campaign_name]
-        )
-      if (
-          sheet_name == data_references.SheetNames.new_campaigns
-          and len(row) > data_references.NewCampaigns.campaign_name
-      ):
-        row_key = (
-            row[data_references.NewCampaigns.customer_name]
-            + ";"
-            + row[data_references.NewCampaigns.campaign_name]
-        )
-      if sheet_name == data_references.SheetNames.asset_groups:
-        row_key = (
-            row[data_references.AssetGroupList.customer_name]
-            + ";"
-            + row[data_references.AssetGroupList.campaign_name]
-            + ";"
-            + row[data_references.AssetGroupList.asset_group_name]
-        )
-      if (
-          sheet_name == data_references.SheetNames.new_asset_groups
-          and len(row)
-          > data_references.newAssetGroupsColumnMap.ASSET_GROUP_NAME.value
-      ):
-        row_key = (
-            row[data_references.newAssetGroupsColumnMap.CUSTOMER_NAME.value]
-            + ";"
-            + row[data_references.newAssetGroupsColumnMap.CAMPAIGN_NAME.value]
-            + ";"
-            + row[
-                data_references.newAssetGroupsColumnMap.ASSET_GROUP_NAME.value
-            ]
-        )
+      row_key = self._get_sheet_row_key(row, sheet_name)
+      if row_key is not None:
+        index.setdefault(row_key, row)
+
+    return index
+
+  def get_sheet_range_index(
+      self, cell_range: str, sheet_name: str
+  ) -> Mapping[str | tuple[str, ...], Sequence[str | int]]:
+    """Retrieves the rows of a sheet range indexed by their unique key.
 
-      if row_key == key:
-        result = row
-        break
+    While reads are cached, the index is built once per cached range and
+    reused by later lookups.
 
-    return result
+    Args:
+      cell_range: String representation of sheet range. For example,
+        "sheet_name!A:C".
+      sheet_name: Enum input with type from Sheets Enum.
+
+    Returns:
+      Mapping of row key to row values, as returned by get_sheet_index.
+    """
+    sheet_values = self.get_sheet_values(cell_range)
+    # A cached index is only valid for the exact values it was built from,
+    # values read again after a write get a new index.
+    indexed_values, index = self._index_cache.get(cell_range, (None, None))
+    if indexed_values is sheet_values:
+      return index
+
+    index = self.get_sheet_index(sheet_values, sheet_name)
+    if self._values_cache is not None:
+      self._index_cache[cell_range] = (sheet_values, index)
+    return index
+
+  def _get_sheet_row_key(
+      self, row: Sequence[str | int], sheet_name: str
+  ) -> str | tuple[str, ...] | None:
+    """Compiles the unique key of a sheet row.
+
+    Args:
+      row: Array of row values.
+      sheet_name: Enum input with type from Sheets Enum.
+
+    Returns:
+      The row key, or None if the row is too short to hold one. The key is
+      the value of the key column for sheets with one key column, and the
+      tuple of the key column values otherwise, for example
+      ("Customer1", "Campaign1") for a campaign row.
+    """
+    key_columns = _SHEET_ROW_KEY_COLUMNS.get(sheet_name)
+    if not key_columns or len(row) <= max(key_columns):
+      return None
+
+    if len(key_columns) == 1:
+      return row[key_columns[0]]
+    return tuple(row[column] for column in key_columns)
 
   def batch_update_requests(self, request_lists: _RequestNote) -> None:
     """Batch update row with requests in target sheet.
 
+    Batches rejected as too large are split in two halves, which are sent one
+    after the other so the requests are still applied in order.
+
     Args:
       request_lists: Request data list.
     """
+    if not request_lists:
+      return
     batch_update_spreadsheet_request_body = {"requests": request_lists}
-    self._sheets_service.batchUpdate(
-        spreadsheetId=self.spread_sheet_id,
-        body=batch_update_spreadsheet_request_body,
-    ).execute()
+    try:
+      self._execute(
+          self._sheets_service.batchUpdate(
+              spreadsheetId=self.spread_sheet_id,
+              body=batch_update_spreadsheet_request_body,
+          )
+      )
+    except errors.HttpError as e:
+      if e.resp.status != _PAYLOAD_TOO_LARGE or len(request_lists) < 2:
+        raise
+      logging.info(
+          "Splitting batch update of %d requests.", len(request_lists)
+      )
+      half = len(request_lists) // 2
+      self.batch_update_requests(request_lists[:half])
+      self.batch_update_requests(request_lists[half:])
+    # Requests address sheets by id, so drop all cached values.
+    self.invalidate_range()
+
+  def queue_update_requests(self, request_lists: _RequestNote) -> None:
+    """Queues update requests to be sent with the next flush.
+
+    Args:
+      request_lists: Request data list.
+    """
+    self._pending_requests.extend(request_lists)
+
+  def flush_update_requests(self) -> None:
+    """Sends all queued rows and update requests.
+
+    Queued rows are appended with one request per sheet, and the update
+    requests, including the column formats of the appended asset and
+    sitelink rows, are sent in a single batch update. Single cell updates of
+    consecutive rows are merged, and sort requests go last, since the queued
+    updates address rows by their position before sorting.
+
+    All queues are taken before anything is sent, so requests are never sent
+    twice by a later flush. The update requests are sent even if an append
+    fails, so the statuses of the processed rows are not lost. If the batch
+    update fails too, the append error is raised.
+
+    Raises:
+      Exception: If unknown error occurs while updating rows.
+    """
+    pending_rows = self._pending_rows
+    pending_outputs = self._pending_outputs
+    pending_requests = self._pending_requests
+    pending_sorts = self._pending_sorts
+    self._pending_rows = {}
+    self._pending_outputs = {}
+    self._pending_requests = []
+    self._pending_sorts = {}
+    append_error = None
+    try:
+      for sheet_range, rows in pending_rows.items():
+        resource = {"majorDimension": "ROWS", "values": rows}
+        try:
+          self._execute(
+              self._sheets_service.values().append(
+                  spreadsheetId=self.spread_sheet_id,
+                  range=sheet_range,
+                  body=resource,
+                  valueInputOption="USER_ENTERED",
+                  insertDataOption="INSERT_ROWS",
+              )
+          )
+          self.invalidate_range(sheet_range)
+        except errors.HttpError as e:
+          logging.error("Unable to append Sheet rows: %s", str(e))
+          raise e
+
+      for sheet_range, (
+          sheet_output,
+          update_columns,
+          account_map,
+      ) in pending_outputs.items():
+        resource = {"values": sheet_output}
+        try:
+          response = self._execute(
+              self._sheets_service.values().append(
+                  spreadsheetId=self.spread_sheet_id,
+                  range=sheet_range,
+                  body=resource,
+                  valueInputOption="USER_ENTERED",
+                  insertDataOption="INSERT_ROWS",
+              )
+          )
+          self.invalidate_range(sheet_range)
+        except errors.HttpError as e:
+          logging.error("Unable to update Sheet rows: %s ", str(e))
+          raise e
+        # Queues the column formats of the appended rows for the batch update
+        # below.
+        update_columns(response, sheet_output, account_map)
+    except Exception as e:
+      # Raised after the update requests are sent.
+      append_error = e
+
+    # Adds the column formats queued by the appends above.
+    pending_requests.extend(self._pending_requests)
+    pending_sorts.update(self._pending_sorts)
+    self._pending_requests = []
+    self._pending_sorts = {}
+    if pending_requests or pending_sorts:
+      update_request_list = _merge_cell_updates(pending_requests)
+      update_request_list.extend(pending_sorts.values())
+      try:
+        self.batch_update_requests(update_request_list)
+      except errors.HttpError as e:
+        logging.error("Unable to update Sheet rows: %s", str(e))
+        # Raises the append error, which happened first, with the batch
+        # update error attached.
+        if append_error is not None:
+          raise append_error from e
+        raise e
+
+    if append_error is not None:
+      raise append_error
+
 
   def get_sheet_id_by_name(self, sheet_name: str) -> str:
     """Get sheet id by sheet name.
 
+    The sheet ids of the spreadsheet are fetched once and reused by later
+    lookups. They are fetched again only for an unknown sheet name, for
+    example after a sheet has been added to the spreadsheet.
+
     Args:
       sheet_name: Sheet name.
 
     Returns:
       sheet_id: Id of the sheet with the given name. Not a spreadsheet id.
     """
-    spreadsheet = self._sheets_service.get(
-        spreadsheetId=self.spread_sheet_id
-    ).execute()
-    for sheet in spreadsheet["sheets"]:
-      if sheet["properties"]["title"] == sheet_name:
-        return sheet["properties"]["sheetId"]
+    if sheet_name not in self._sheet_ids:
+      spreadsheet = self._execute(
+          self._sheets_service.get(
+              spreadsheetId=self.spread_sheet_id,
+              fields="sheets.properties(sheetId,title)",
+          )
+      )
+      self._sheet_ids = {
+          sheet["properties"]["title"]: sheet["properties"]["sheetId"]
+          for sheet in spreadsheet["sheets"]
+      }
+
+    return self._sheet_ids.get(sheet_name)
 
   def get_status_note(
       self, row_index: int, col_index: int, input_value: str, sheet_id: str
@@ -228,52 +887,90 @@ class SheetsService:
     }
     return error_note
 
+  def get_status_notes(
+      self,
+      row_index: int,
+      col_index: int,
+      input_values: Sequence[Sequence[str]],
+      sheet_id: str,
+  ) -> _RequestNote:
+    """Retrieves a block of target cells to update in the Sheet.
+
+    Args:
+      row_index: Row index of the top left cell.
+      col_index: Column index of the top left cell.
+      input_values: Cell input values (strings), one array per row.
+      sheet_id: Sheet id for the Sheet.
+
+    Returns:
+      notes: Cell information for updating the block of cells.
+    """
+    notes = {
+        "updateCells": {
+            "start": {
+                "sheetId": sheet_id,
+                "rowIndex": row_index,
+                "columnIndex": col_index,
+            },
+            "rows": [
+                {
+                    "values": [
+                        {"userEnteredValue": {"stringValue": value}}
+                        for value in row
+                    ]
+                }
+                for row in input_values
+            ],
+            "fields": "userEnteredValue",
+        }
+    }
+    return notes
+
   def get_checkbox(
-      self, row_index: int, col_index: int, sheet_id: str
+      self, row_index: int, col_index: int, sheet_id: str, row_count: int = 1
   ) -> _CheckboxCell:
     """Retrieves target cells to update checkbox in the Sheet.
 
     Args:
-      row_index: Row index of the target cell.
-      col_index: Column index of the target cell.
+      row_index: Row index of the first target cell.
+      col_index: Column index of the target cells.
       sheet_id: Sheet id for the Sheet.
+      row_count: Number of target cells in the column, starting at row_index.
 
     Returns:
       checkbox: cell information for updating checkbox.
     """
     checkbox = {
-        "updateCells": {
-            "start": {
+        "repeatCell": {
+            "range": {
                 "sheetId": sheet_id,
-                "rowIndex": row_index,
-                "columnIndex": col_index,
+                "startRowIndex": row_index,
+                "endRowIndex": row_index + row_count,
+                "startColumnIndex": col_index,
+                "endColumnIndex": col_index + 1,
             },
-            "rows": [{
-                "values": [
-                    {
-                        "dataValidation": {
-                            "condition": {
-                                "type": "BOOLEAN",
-                            }
-                        }
-                    }
-                ]
-            }],
+            "cell": _CHECKBOX_CELL,
             "fields": "dataValidation",
         }
     }
     return checkbox
 
   def get_dropdown(
-      self, row_index: int, col_index: int, input_value: str, sheet_id: str
+      self,
+      row_index: int,
+      col_index: int,
+      input_value: str,
+      sheet_id: str,
+      row_count: int = 1,
   ) -> _DropdownCell:
     """Retrieves target cells to update checkbox in the Sheet.
 
     Args:
-      row_index: Row index of the target cell.
-      col_index: Column index of the target cell.
+      row_index: Row index of the first target cell.
+      col_index: Column index of the target cells.
       input_value: Comma seperated string with dropdown values.
       sheet_id: Sheet id for the Sheet.
+      row_count: Number of target cells in the column, starting at row_index.
 
     Returns:
       dropdown: Cell information for updating dropdown.
@@ -290,7 +987,7 @@ class SheetsService:
             "range": {
                 "sheetId": sheet_id,
                 "startRowIndex": row_index,
-                "endRowIndex": row_index + 1,
+                "endRowIndex": row_index + row_count,
                 "startColumnIndex": col_index,
                 "endColumnIndex": col_index + 1,
             },
@@ -303,35 +1000,6 @@ class SheetsService:
     }
     return dropdown
 
-  def get_thumbnail(
-      self, row_index: int, col_index: int, sheet_id: str
-  ) -> _Thumbnail:
-    """Retrieves target cells to update checkbox in the Sheet.
-
-    Args:
-      row_index: Row index of the target cell.
-      col_index: Column index of the target cell.
-      sheet_id: Sheet id for the Sheet.
-
-    Returns:
-      thumbnail: Cell information for updating cell with image formula.
-    """
-    formula = "=IMAGE(I" + str(row_index + 1) + ")"
-    thumbnail = {
-        "updateCells": {
-            "start": {
-                "sheetId": sheet_id,
-                "rowIndex": row_index,
-                "columnIndex": col_index,
-            },
-            "rows": [
-                {"values": [{"userEnteredValue": {"formulaValue": formula}}]}
-            ],
-            "fields": "userEnteredValue",
-        }
-    }
-    return thumbnail
-
   def get_sort_request(
       self,
       row_index: int,
@@ -378,7 +1046,9 @@ class SheetsService:
       resource_name: str = "",
       resource_col_id: int = None,
   ) -> None:
-    """Update status and error message (if provided) in the sheet.
+    """Queues the status and error message (if provided) for the sheet.
+
+    The update is written to the sheet by flush_update_requests.
 
     Args:
       row_index: Index of sheet row.
@@ -389,9 +1059,6 @@ class SheetsService:
       message_col_id: Column of error messgae position.
       resource_name: Optional Google Ads resource name.
       resource_col_id: Column index of resource name.
-
-    Raises:
-      Exception: If unknown error occurs while updating rows.
     """
     update_request_list = []
 
@@ -412,17 +1079,13 @@ class SheetsService:
     if resource_col_id:
       request = self.get_status_note(
           row_index + _SHEET_HEADER_SIZE,
-          message_col_id,
-          error_message,
+          resource_col_id,
+          resource_name,
           sheet_id,
       )
       update_request_list.append(request)
 
-    try:
-      self.batch_update_requests(update_request_list)
-    except errors.HttpError as e:
-      logging.error("Unable to update Sheet rows: %s", str(e))
-      raise e
+    self.queue_update_requests(update_request_list)
 
   def bulk_update_sheet_status(
       self,
@@ -432,7 +1095,9 @@ class SheetsService:
       asset_resource_col_id: int,
       results: Mapping[str, str | Mapping[str, str]],
   ) -> None:
-    """Update status and error message in the sheet.
+    """Queues the status and error message updates for the sheet.
+
+    The updates are written to the sheet by flush_update_requests.
 
     Args:
       sheet_name: Name of the sheet.
@@ -440,39 +1105,31 @@ class SheetsService:
       message_col_id: Column number of the error message on the sheet.
       asset_resource_col_id: Column number of the error message on the sheet.
       results: Array of containing status, error messages and asset resources.
-
-    Raises:
-      Exception: If unknown error occurs while updating rows.
     """
     update_request_list = []
     sheet_id = self.get_sheet_id(sheet_name)
+    result_keys = {
+        status_col_id: "status",
+        message_col_id: "message",
+        asset_resource_col_id: "asset_group_asset",
+    }
 
-    for row in results:
-      row_to_update = row + _SHEET_HEADER_SIZE
-      status = self.get_status_note(
-          row_to_update, status_col_id, results[row]["status"], sheet_id
-      )
-      update_request_list.append(status)
-
-      message = self.get_status_note(
-          row_to_update, message_col_id, results[row]["message"], sheet_id
-      )
-      update_request_list.append(message)
-
-      asset_resource = self.get_status_note(
-          row_to_update,
-          asset_resource_col_id,
-          results[row]["asset_group_asset"],
-          sheet_id,
-      )
-      update_request_list.append(asset_resource)
+    # Rows and columns next to each other are written with one request each.
+    for row_run in _split_into_runs(sorted(results)):
+      for col_run in _split_into_runs(sorted(result_keys)):
+        update_request_list.append(
+            self.get_status_notes(
+                row_run[0] + _SHEET_HEADER_SIZE,
+                col_run[0],
+                [
+                    [results[row][result_keys[col]] for col in col_run]
+                    for row in row_run
+                ],
+                sheet_id,
+            )
+        )
 
-    try:
-      if update_request_list:
-        self.batch_update_requests(update_request_list)
-    except errors.HttpError as e:
-      logging.error("Unable to update Sheet rows: %s", str(e))
-      raise e
+    self.queue_update_requests(update_request_list)
 
   def get_sheet_id(self, sheet_name: str) -> str:
     """Get sheet id of provided sheet name.
@@ -496,207 +1153,193 @@ class SheetsService:
   def add_new_asset_group_to_list_sheet(
       self, asset_group_sheetlist: Sequence[str]
   ) -> None:
-    """Update error message in the sheet.
+    """Queues the new asset group to be added to the asset group list.
+
+    The row is appended with the next flush, together with the other asset
+    groups created in the same run.
 
     Args:
         asset_group_sheetlist: Array containing the information of the new asset
           group.
-
-    Raises:
-        Exception: If unknown error occurs while updating rows in the Time
-          Managed Sheet.
     """
-    resource = {"majorDimension": "ROWS", "values": [asset_group_sheetlist]}
     sheet_range = (
         data_references.SheetNames.asset_groups
         + "!"
         + data_references.SheetRanges.asset_groups
     )
-
-    try:
-      self._sheets_service.values().append(
-          spreadsheetId=self.spread_sheet_id,
-          range=sheet_range,
-          body=resource,
-          valueInputOption="USER_ENTERED",
-      ).execute()
-    except errors.HttpError as e:
-      logging.error("Couldn't update Assets Group to a sheet \n %s", str(e))
-      raise e
+    self._pending_rows.setdefault(sheet_range, []).append(
+        asset_group_sheetlist
+    )
 
   def add_new_campaign_to_list_sheet(
       self, campaign_sheetlist: Sequence[str]
   ) -> None:
-    """Update error message in the sheet.
+    """Queues the new campaign to be added to the campaign list.
 
-    Args:
-        campaign_sheetlist: Array containing the information of the new asset
-          group.
+    The row is appended with the next flush, together with the other
+    campaigns created in the same run.
 
-    Raises:
-        Exception: If unknown error occurs while updating rows.
+    Args:
+        campaign_sheetlist: Array containing the information of the new
+          campaign.
     """
-    resource = {"majorDimension": "ROWS", "values": [campaign_sheetlist]}
-    sheet_range = "CampaignList!A:D"
+    sheet_range = (
+        data_references.SheetNames.campaigns
+        + "!"
+        + data_references.SheetRanges.campaigns
+    )
+    self._pending_rows.setdefault(sheet_range, []).append(campaign_sheetlist)
 
-    try:
-      self._sheets_service.values().append(
-          spreadsheetId=self.spread_sheet_id,
-          range=sheet_range,
-          body=resource,
-          valueInputOption="USER_ENTERED",
-      ).execute()
-    except errors.HttpError as e:
-      logging.error("Unable to update Sheet rows: %s ", str(e))
-      raise e
+  def _queue_sheet_output(
+      self,
+      sheet_range: str,
+      sheet_output: Sequence[Sequence[str | int]],
+      update_columns: Callable[..., None],
+      account_map: Mapping[str, Mapping[str, str]],
+  ) -> None:
+    """Queues rows whose custom columns are set once they are appended.
+
+    Args:
+      sheet_range: String representation of the sheet range to append to.
+      sheet_output: Array of rows to append.
+      update_columns: Method queueing the custom column updates of the
+        appended rows, called with the append response, the rows and the
+        account map.
+      account_map: Google Ads account map, account ids and names.
+    """
+    queued_output, _, _ = self._pending_outputs.get(
+        sheet_range, ([], None, None)
+    )
+    queued_output.extend(sheet_output)
+    self._pending_outputs[sheet_range] = (
+        queued_output,
+        update_columns,
+        account_map,
+    )
 
   def update_asset_sheet_output(
       self,
       results: Sequence[Sequence[str | int]],
       account_map: Mapping[str, Mapping[str, str]],
+      existing_resource_names: set[str] | None = None,
   ) -> None:
     """Write exisitng assets to asset sheet.
 
+    The new rows are queued and appended by flush_update_requests, together
+    with the rows of the other customers of the same refresh.
+
     Args:
       results: Array of array containing the existing assets in Google Ads.
       account_map: Google Ads account map, account ids and names.
+      existing_resource_names: Resource names of the assets already in the
+        sheet, read from the sheet if None. The resource names of the written
+        assets are added to it, so it can be reused for the next update.
     """
     sheet_output = []
-
-    asset_resource_column = "!L:L"
     sheet_range = data_references.SheetNames.assets + "!A:L"
 
-    asset_group_asset_values = self.get_sheet_values(
-        data_references.SheetNames.assets + asset_resource_column
-    )
+    if existing_resource_names is None:
+      existing_resource_names = _get_column_values(
+          self.get_sheet_values(_ASSET_RESOURCE_RANGE)
+      )
 
-    index = 0
     for row in results:
       resource_name = row.asset_group_asset.resource_name
 
-      if [resource_name] not in asset_group_asset_values:
-        # Create empty list of lists with lenght of sheet row.
-        sheet_output.append(
-            [None] * (data_references.Assets.asset_group_asset + 1)
-        )
-        sheet_output = self.create_sheet_output_for_writing_into(
-            row, resource_name, sheet_output, index
-        )
-
-        index += 1
+      if resource_name not in existing_resource_names:
+        existing_resource_names.add(resource_name)
+        sheet_output.append(self.create_asset_sheet_row(row, resource_name))
 
-    value_input_option = "USER_ENTERED"
-    insert_data_option = "INSERT_ROWS"
-    value_range_body = {"values": sheet_output}
-
-    try:
-      request = self._sheets_service.values().append(
-          spreadsheetId=self.spread_sheet_id,
-          range=sheet_range,
-          valueInputOption=value_input_option,
-          insertDataOption=insert_data_option,
-          body=value_range_body,
+    # Nothing new since the last refresh, skip the no-op write.
+    if sheet_output:
+      self._queue_sheet_output(
+          sheet_range, sheet_output, self.update_assets_columns, account_map
       )
-      response = request.execute()
-    except errors.HttpError as e:
-      logging.error("Unable to update Sheet rows: %s ", str(e))
-      raise e
-
-    self.update_assets_columns(response, sheet_output, account_map)
 
-  def create_sheet_output_for_writing_into(
+  def create_asset_sheet_row(
       self,
       row: Sequence[str | int],
       resource_name: str,
-      sheet_output: Sequence[Sequence[str | int]],
-      index: int,
-  ) -> Sequence[Sequence[str, int]]:
-    """Create output array for writing into spreadsheet.
+  ) -> Sequence[str | int]:
+    """Create output row for writing into spreadsheet.
 
     Args:
       row: Array containing the asset infortmation for writing into spreadsheet.
       resource_name: Asset resource name.
-      sheet_output: Output array for spreadsheet write.
-      index: Index of the row where data should be populated.
 
     Returns:
-      Array of arrays representing an index and row data.
+      Array representing the row data, one value per Assets sheet column.
     """
     asset_type = row.asset_group_asset.field_type.name
+    # Columns not set below are left empty.
+    sheet_row = [None] * (data_references.Assets.asset_group_asset + 1)
+
+    sheet_row[data_references.Assets.asset_group_name] = row.asset_group.name
+    sheet_row[data_references.Assets.asset_thumbnail] = ""
+    sheet_row[data_references.Assets.type] = asset_type
 
-    sheet_output[index][
-        data_references.Assets.asset_group_name
-    ] = row.asset_group.name
-    sheet_output[index][data_references.Assets.asset_thumbnail] = ""
-    sheet_output[index][data_references.Assets.type] = asset_type
-
-    sheet_output[index][data_references.Assets.status] = "UPLOADED"
-    sheet_output[index][data_references.Assets.delete_asset] = ""
-    sheet_output[index][
-        data_references.Assets.customer_name
-    ] = row.customer.descriptive_name
-    sheet_output[index][
-        data_references.Assets.campaign_name
-    ] = row.campaign.name
-
-    sheet_output[index][data_references.Assets.error_message] = ""
-    sheet_output[index][
-        data_references.Assets.asset_group_asset
-    ] = resource_name
-
-    if asset_type in [
-        data_references.AssetTypes.headline,
-        data_references.AssetTypes.description,
-        data_references.AssetTypes.long_headline,
-        data_references.AssetTypes.business_name,
-    ]:
-      sheet_output[index][
-          data_references.Assets.asset_text
-      ] = row.asset.text_asset.text
-      sheet_output[index][data_references.Assets.asset_call_to_action] = ""
-      sheet_output[index][data_references.Assets.asset_url] = ""
-
-    if asset_type in [
-        data_references.AssetTypes.marketing_image,
-        data_references.AssetTypes.square_image,
-        data_references.AssetTypes.portrait_marketing_image,
-        data_references.AssetTypes.square_logo,
-        data_references.AssetTypes.landscape_logo,
-    ]:
-      sheet_output[index][data_references.Assets.asset_text] = row.asset.name
-      sheet_output[index][data_references.Assets.asset_call_to_action] = ""
-      sheet_output[index][
-          data_references.Assets.asset_url
-      ] = row.asset.image_asset.full_size.url
-
-    if asset_type == data_references.AssetTypes.call_to_action:
-      sheet_output[index][data_references.Assets.asset_text] = row.asset.name
-      sheet_output[index][data_references.Assets.asset_call_to_action] = (
+    sheet_row[data_references.Assets.status] = "UPLOADED"
+    sheet_row[data_references.Assets.delete_asset] = ""
+    sheet_row[data_references.Assets.customer_name] = (
+        row.customer.descriptive_name
+    )
+    sheet_row[data_references.Assets.campaign_name] = row.campaign.name
+
+    sheet_row[data_references.Assets.error_message] = ""
+    sheet_row[data_references.Assets.asset_group_asset] = resource_name
+
+    # Asset types are exclusive, checks stop at the first matching type.
+    if asset_type in _TEXT_ASSET_TYPES:
+      sheet_row[data_references.Assets.asset_text] = row.asset.text_asset.text
+      sheet_row[data_references.Assets.asset_call_to_action] = ""
+      sheet_row[data_references.Assets.asset_url] = ""
+
+    elif asset_type in _IMAGE_ASSET_TYPES:
+      image_url = row.asset.image_asset.full_size.url
+      sheet_row[data_references.Assets.asset_text] = row.asset.name
+      sheet_row[data_references.Assets.asset_call_to_action] = ""
+      sheet_row[data_references.Assets.asset_url] = image_url
+      # The URL is written into the formula itself, so the thumbnail does not
+      # depend on the URL cell. Quotes in string literals are doubled.
+      sheet_row[data_references.Assets.asset_thumbnail] = (
+          '=IMAGE("' + image_url.replace('"', '""') + '")'
+      )
+
+    elif asset_type == data_references.AssetTypes.call_to_action:
+      sheet_row[data_references.Assets.asset_text] = row.asset.name
+      sheet_row[data_references.Assets.asset_call_to_action] = (
           self.google_ads_client.enums.CallToActionTypeEnum(
               row.asset.call_to_action_asset.call_to_action
           ).name
       )
-      sheet_output[index][data_references.Assets.asset_url] = ""
+      sheet_row[data_references.Assets.asset_url] = ""
 
-    if asset_type == data_references.AssetTypes.youtube_video:
-      sheet_output[index][data_references.Assets.asset_text] = row.asset.name
-      sheet_output[index][data_references.Assets.asset_call_to_action] = ""
-      sheet_output[index][data_references.Assets.asset_url] = (
+    elif asset_type == data_references.AssetTypes.youtube_video:
+      sheet_row[data_references.Assets.asset_text] = row.asset.name
+      sheet_row[data_references.Assets.asset_call_to_action] = ""
+      sheet_row[data_references.Assets.asset_url] = (
           "https://www.youtube.com/watch?v="
           + row.asset.youtube_video_asset.youtube_video_id
       )
-    return sheet_output
+    return sheet_row
 
   def update_sitelink_sheet_output(
       self,
       results: Sequence[Sequence[str | int]],
       account_map: Mapping[str, Mapping[str, str]],
+      existing_resource_names: set[str] | None = None,
   ) -> None:
     """Write exisitng assets to asset sheet.
 
+    The new rows are queued and appended by flush_update_requests, together
+    with the rows of the other customers of the same refresh.
+
     Args:
       results: Array of array containing the existing assets in Google Ads.
       account_map: Google Ads account map, account ids and names.
+      existing_resource_names: Resource names of the sitelinks already in the
+        sheet, read from the sheet if None. The resource names of the written
+        sitelinks are added to it, so it can be reused for the next update.
     """
     sheet_output = []
     sheet_range = (
@@ -705,76 +1348,63 @@ class SheetsService:
         + data_references.SheetRanges.sitelinks
     )
 
-    asset_group_asset_values = self.get_sheet_values(
-        data_references.SheetNames.sitelinks + "!J:J"
-    )
+    if existing_resource_names is None:
+      existing_resource_names = _get_column_values(
+          self.get_sheet_values(_SITELINK_RESOURCE_RANGE)
+      )
 
-    index = 0
     for row in results:
       resource_name = row.campaign_asset.resource_name
 
-      if [resource_name] not in asset_group_asset_values:
-        # Create empty list of lists with lenght of sheet row.
-        sheet_output.append(
-            [None] * (data_references.Sitelinks.sitelink_resource + 1)
-        )
-
-        sheet_output[index][
-            data_references.Sitelinks.upload_status
-        ] = "UPLOADED"
-        sheet_output[index][data_references.Sitelinks.delete_sitelink] = ""
-        sheet_output[index][
-            data_references.Sitelinks.customer_name
-        ] = row.customer.descriptive_name
-        sheet_output[index][
-            data_references.Sitelinks.campaign_name
-        ] = row.campaign.name
-
-        sheet_output[index][data_references.Sitelinks.error_message] = ""
-        sheet_output[index][
-            data_references.Sitelinks.sitelink_resource
-        ] = resource_name
-
-        sheet_output[index][data_references.Sitelinks.final_urls] = (
-            row.asset.final_urls[0]
-        )
-        sheet_output[index][
-            data_references.Sitelinks.link_text
-        ] = row.asset.sitelink_asset.link_text
-        sheet_output[index][
-            data_references.Sitelinks.description1
-        ] = row.asset.sitelink_asset.description1
-        sheet_output[index][
-            data_references.Sitelinks.description2
-        ] = row.asset.sitelink_asset.description2
-        sheet_output[index][
-            data_references.Sitelinks.sitelink_resource
-        ] = row.campaign_asset.resource_name
-
-        index += 1
-
-    value_input_option = "USER_ENTERED"
-    insert_data_option = "INSERT_ROWS"
-    value_range_body = {"values": sheet_output}
+      if resource_name not in existing_resource_names:
+        existing_resource_names.add(resource_name)
+        sheet_output.append(self.create_sitelink_sheet_row(row, resource_name))
 
-    try:
-      request = self._sheets_service.values().append(
-          spreadsheetId=self.spread_sheet_id,
-          range=sheet_range,
-          valueInputOption=value_input_option,
-          insertDataOption=insert_data_option,
-          body=value_range_body,
+    # Nothing new since the last refresh, skip the no-op write.
+    if sheet_output:
+      self._queue_sheet_output(
+          sheet_range, sheet_output, self.update_sitelinks_columns, account_map
       )
-      response = request.execute()
-    except errors.HttpError as e:
-      logging.error("Unable to update Sheet rows: %s ", str(e))
-      raise e
 
-    self.update_sitelinks_columns(
-        response,
-        sheet_output,
-        account_map,
+  def create_sitelink_sheet_row(
+      self,
+      row: Sequence[str | int],
+      resource_name: str,
+  ) -> Sequence[str | int]:
+    """Create sitelink output row for writing into spreadsheet.
+
+    Args:
+      row: Array containing the sitelink information for writing into
+        spreadsheet.
+      resource_name: Campaign asset resource name.
+
+    Returns:
+      Array representing the row data, one value per Sitelinks sheet column.
+    """
+    # Columns not set below are left empty.
+    sheet_row = [None] * (data_references.Sitelinks.sitelink_resource + 1)
+
+    sheet_row[data_references.Sitelinks.upload_status] = "UPLOADED"
+    sheet_row[data_references.Sitelinks.delete_sitelink] = ""
+    sheet_row[data_references.Sitelinks.customer_name] = (
+        row.customer.descriptive_name
     )
+    sheet_row[data_references.Sitelinks.campaign_name] = row.campaign.name
+
+    sheet_row[data_references.Sitelinks.error_message] = ""
+    sheet_row[data_references.Sitelinks.sitelink_resource] = resource_name
+
+    sheet_row[data_references.Sitelinks.final_urls] = row.asset.final_urls[0]
+    sheet_row[data_references.Sitelinks.link_text] = (
+        row.asset.sitelink_asset.link_text
+    )
+    sheet_row[data_references.Sitelinks.description1] = (
+        row.asset.sitelink_asset.description1
+    )
+    sheet_row[data_references.Sitelinks.description2] = (
+        row.asset.sitelink_asset.description2
+    )
+    return sheet_row
 
   def update_assets_columns(
       self,
@@ -784,6 +1414,8 @@ class SheetsService:
   ) -> None:
     """Update custom columns in Assets Sheet.
 
+    The updates are written to the sheet by flush_update_requests.
+
     Args:
       response: API response object for Asset Sheet update.
       sheet_output: Input sheet object with the relevant new sheet values.
@@ -791,72 +1423,73 @@ class SheetsService:
     """
     if response["tableRange"]:
       sheet_id = self.get_sheet_id(data_references.SheetNames.assets)
-      start_row = int(re.search("([0-9]*$)", response["tableRange"]).group())
+      start_row = int(
+          _TABLE_RANGE_END_ROW.search(response["tableRange"]).group(1)
+      )
       update_request_list = []
-      i = 0
-      if "updatedRows" in response["updates"]:
-        customer_list = list(account_map.keys())
-        while i < response["updates"]["updatedRows"]:
-          update_request_list.append(
-              self.get_checkbox(
-                  start_row + i, data_references.Assets.delete_asset, sheet_id
-              )
-          )
-          update_request_list.append(
-              self.get_thumbnail(
-                  start_row + i,
-                  data_references.Assets.asset_thumbnail,
-                  sheet_id,
-              )
-          )
-          update_request_list.append(
-              self.get_dropdown(
-                  start_row + i,
-                  data_references.Assets.customer_name,
-                  customer_list,
-                  sheet_id,
-              )
-          )
-          if sheet_output[i][data_references.Assets.customer_name]:
-            campaign_list = list(
-                account_map[
-                    sheet_output[i][data_references.Assets.customer_name]
-                ].keys()
+      # Appends that added no rows leave no columns to update.
+      if row_count := response["updates"].get("updatedRows"):
+        new_rows = sheet_output[:row_count]
+        # Columns with the same content for all new rows, or for a run of
+        # rows, are each updated with one request.
+        update_request_list.append(
+            self.get_checkbox(
+                start_row,
+                data_references.Assets.delete_asset,
+                sheet_id,
+                row_count,
             )
+        )
+        update_request_list.append(
+            self.get_dropdown(
+                start_row,
+                data_references.Assets.customer_name,
+                list(account_map.keys()),
+                sheet_id,
+                row_count,
+            )
+        )
+
+        for customer_name, i, run_count in _group_consecutive(
+            [row[data_references.Assets.customer_name] for row in new_rows]
+        ):
+          if customer_name:
             update_request_list.append(
                 self.get_dropdown(
                     start_row + i,
                     data_references.Assets.campaign_name,
-                    campaign_list,
+                    list(account_map[customer_name].keys()),
                     sheet_id,
+                    run_count,
                 )
             )
 
-          if account_map[sheet_output[i][data_references.Assets.customer_name]][
-              sheet_output[i][data_references.Assets.campaign_name]
-          ]:
-            asset_group_list = account_map[
-                sheet_output[i][data_references.Assets.customer_name]
-            ][sheet_output[i][data_references.Assets.campaign_name]]
+        for (customer_name, campaign_name), i, run_count in _group_consecutive([
+            (
+                row[data_references.Assets.customer_name],
+                row[data_references.Assets.campaign_name],
+            )
+            for row in new_rows
+        ]):
+          # Rows with a blank or unknown customer or campaign get no
+          # asset group dropdown instead of aborting the whole update.
+          if asset_group_list := account_map.get(customer_name, {}).get(
+              campaign_name
+          ):
             update_request_list.append(
                 self.get_dropdown(
                     start_row + i,
                     data_references.Assets.asset_group_name,
                     asset_group_list,
                     sheet_id,
+                    run_count,
                 )
             )
 
-          i += 1
-
-        sort = self.get_sort_request(_SHEET_HEADER_SIZE, 0, sheet_id, 0, 3)
-        update_request_list.append(sort)
-
-        try:
-          self.batch_update_requests(update_request_list)
-        except errors.HttpError as e:
-          logging.error("Unable to update Sheet rows: %s ", str(e))
-          raise e
+        self.queue_update_requests(update_request_list)
+        self._pending_sorts[sheet_id] = self.get_sort_request(
+            _SHEET_HEADER_SIZE, 0, sheet_id, 0, 3
+        )
 
   def update_sitelinks_columns(
       self,
@@ -866,6 +1499,8 @@ class SheetsService:
   ) -> None:
     """Update custom columns in Assets Sheet.
 
+    The updates are written to the sheet by flush_update_requests.
+
     Args:
       response: API response object for Asset Sheet update.
       sheet_output: Input sheet object with the relevant new sheet values.
@@ -873,178 +1508,314 @@ class SheetsService:
     """
     if response["tableRange"]:
       sheet_id = self.get_sheet_id(data_references.SheetNames.sitelinks)
-      start_row = int(re.search("([0-9]*$)", response["tableRange"]).group())
+      start_row = int(
+          _TABLE_RANGE_END_ROW.search(response["tableRange"]).group(1)
+      )
       update_request_list = []
-      i = 0
-      if "updatedRows" in response["updates"]:
-        customer_list = list(account_map.keys())
-        while i < response["updates"]["updatedRows"]:
-          update_request_list.append(
-              self.get_checkbox(
-                  start_row + i,
-                  data_references.Sitelinks.delete_sitelink,
-                  sheet_id,
-              )
-          )
-          update_request_list.append(
-              self.get_dropdown(
-                  start_row + i,
-                  data_references.Sitelinks.customer_name,
-                  customer_list,
-                  sheet_id,
-              )
-          )
-          if sheet_output[i][data_references.Sitelinks.customer_name]:
-            campaign_list = list(
-                account_map[
-                    sheet_output[i][data_references.Sitelinks.customer_name]
-                ].keys()
+      # Appends that added no rows leave no columns to update.
+      if row_count := response["updates"].get("updatedRows"):
+        # Columns with the same content for all new rows, or for a run of
+        # rows, are each updated with one request.
+        update_request_list.append(
+            self.get_checkbox(
+                start_row,
+                data_references.Sitelinks.delete_sitelink,
+                sheet_id,
+                row_count,
+            )
+        )
+        update_request_list.append(
+            self.get_dropdown(
+                start_row,
+                data_references.Sitelinks.customer_name,
+                list(account_map.keys()),
+                sheet_id,
+                row_count,
             )
+        )
+
+        for customer_name, i, run_count in _group_consecutive([
+            row[data_references.Sitelinks.customer_name]
+            for row in sheet_output[:row_count]
+        ]):
+          if customer_name:
             update_request_list.append(
                 self.get_dropdown(
                     start_row + i,
                     data_references.Sitelinks.campaign_name,
-                    campaign_list,
+                    list(account_map[customer_name].keys()),
                     sheet_id,
+                    run_count,
                 )
             )
 
-          i += 1
+        self.queue_update_requests(update_request_list)
+        self._pending_sorts[sheet_id] = self.get_sort_request(
+            _SHEET_HEADER_SIZE, 0, sheet_id, 0, 3
+        )
 
-        sort = self.get_sort_request(_SHEET_HEADER_SIZE, 0, sheet_id, 0, 3)
-        update_request_list.append(sort)
+  def _retrieve_customers(self) -> Sequence[ads_api.ApiResponse]:
+    """Retrieves the customers to refresh from Google Ads.
 
-        try:
-          self.batch_update_requests(update_request_list)
-        except errors.HttpError as e:
-          logging.error("Unable to update Sheet rows: %s ", str(e))
-          raise e
+    The rows are collected into a list, since the customers are iterated more
+    than once per refresh.
+
+    Returns:
+      Customer client rows of the Google Ads search.
+    """
+    return list(
+        self.google_ads_service.retrieve_all_customers(
+            self.login_customer_id, self.customer_id_inclusion_list
+        )
+    )
 
   def refresh_spreadsheet(self) -> None:
     """Update spreadsheet with exisitng assets, asset groups and campaigns."""
     account_map = {}
-    results = self.google_ads_service.retrieve_all_customers(
-        self.login_customer_id, self.customer_id_inclusion_list
-    )
-    account_map = self.update_sheet_lists(
-        results, data_references.SheetNames.customers, "!B:B", account_map
-    )
-
-    for row in results:
-      customer_id = str(row.customer_client.id)
-
-      if customer_id:
-        results = self.google_ads_service.retrieve_all_campaigns(customer_id)
-        account_map = self.update_sheet_lists(
-            results, data_references.SheetNames.campaigns, "!D:D", account_map
-        )
+    results = self._retrieve_customers()
+    customer_ids = _get_customer_ids(results)
+
+    # The id columns of the lists and the resource name columns are read
+    # with one request. Their values are collected once and updated as the
+    # rows of each customer are queued, since new rows are only written on
+    # flush.
+    with self.cached_reads():
+      existing_values = self.batch_get_sheet_values([
+          _CUSTOMER_IDS_RANGE,
+          _CAMPAIGN_IDS_RANGE,
+          _ASSET_GROUP_IDS_RANGE,
+          _ASSET_RESOURCE_RANGE,
+          _SITELINK_RESOURCE_RANGE,
+      ])
+      asset_resource_names = _get_column_values(
+          existing_values[_ASSET_RESOURCE_RANGE]
+      )
+      sitelink_resource_names = _get_column_values(
+          existing_values[_SITELINK_RESOURCE_RANGE]
+      )
+      campaign_ids = _get_column_values(existing_values[_CAMPAIGN_IDS_RANGE])
+      asset_group_ids = _get_column_values(
+          existing_values[_ASSET_GROUP_IDS_RANGE]
+      )
 
-        results = self.google_ads_service.retrieve_all_asset_groups(customer_id)
+      # New rows and their column formats are queued, and written with one
+      # append per sheet and one update request.
+      try:
         account_map = self.update_sheet_lists(
-            results,
-            data_references.SheetNames.asset_groups,
-            "!F:F",
-            account_map,
+            results, data_references.SheetNames.customers, "!B:B", account_map
         )
+        with futures.ThreadPoolExecutor(
+            max_workers=_ADS_MAX_WORKERS
+        ) as executor:
+          # Google Ads queries of the next customers run ahead, while the
+          # results are written to the sheets one customer at a time, in order.
+          for campaigns, asset_groups, assets, sitelinks in zip(
+              _map_ahead(
+                  executor,
+                  self.google_ads_service.retrieve_all_campaigns,
+                  customer_ids,
+              ),
+              _map_ahead(
+                  executor,
+                  self.google_ads_service.retrieve_all_asset_groups,
+                  customer_ids,
+              ),
+              _map_ahead(
+                  executor,
+                  self.google_ads_service.retrieve_all_assets,
+                  customer_ids,
+              ),
+              _map_ahead(
+                  executor,
+                  self.google_ads_service.retrieve_sitelinks,
+                  customer_ids,
+              ),
+          ):
+            account_map = self.update_sheet_lists(
+                campaigns,
+                data_references.SheetNames.campaigns,
+                "!D:D",
+                account_map,
+                campaign_ids,
+            )
+            account_map = self.update_sheet_lists(
+                asset_groups,
+                data_references.SheetNames.asset_groups,
+                "!F:F",
+                account_map,
+                asset_group_ids,
+            )
+            self.update_asset_sheet_output(
+                assets, account_map, asset_resource_names
+            )
+            self.update_sitelink_sheet_output(
+                sitelinks, account_map, sitelink_resource_names
+            )
 
-        results = self.google_ads_service.retrieve_all_assets(customer_id)
-        self.update_asset_sheet_output(results, account_map)
-
-        results = self.google_ads_service.retrieve_sitelinks(customer_id)
-        self.update_sitelink_sheet_output(results, account_map)
-
-    self._set_cell_value(
-        "=SORT(UNIQUE({CustomerList!$A$5:$A}))", "DropDownConfig!N3"
-    )
+        self.queue_customer_dropdown_update()
+      finally:
+        self.flush_update_requests()
 
   def refresh_campaign_list(
       self,
+      customers: Sequence[ads_api.ApiResponse] | None = None,
   ) -> MutableMapping[str, MutableMapping[str, Sequence[str]]]:
-    """Update spreadsheet with Campaign list."""
-    account_map = {}
-    results = self.google_ads_service.retrieve_all_customers(
-        self.login_customer_id, self.customer_id_inclusion_list
-    )
-    account_map = self.update_sheet_lists(
-        results, data_references.SheetNames.customers, "!B:B", account_map
-    )
+    """Update spreadsheet with Campaign list.
 
-    for row in results:
-      customer_id = str(row.customer_client.id)
+    Args:
+      customers: Customers already retrieved by the caller, retrieved from
+        Google Ads if None.
 
-      if customer_id:
-        results = self.google_ads_service.retrieve_all_campaigns(customer_id)
+    Returns:
+      Google Ads account map, account ids and names.
+    """
+    account_map = {}
+    results = customers if customers is not None else self._retrieve_customers()
+    # The id columns are read with one request, later reads of them are
+    # served from the read cache.
+    with self.cached_reads():
+      existing_values = self.batch_get_sheet_values(
+          [_CUSTOMER_IDS_RANGE, _CAMPAIGN_IDS_RANGE]
+      )
+      campaign_ids = _get_column_values(existing_values[_CAMPAIGN_IDS_RANGE])
+
+      # New rows are queued and written with one request per sheet.
+      try:
         account_map = self.update_sheet_lists(
-            results, data_references.SheetNames.campaigns, "!D:D", account_map
+            results, data_references.SheetNames.customers, "!B:B", account_map
         )
+        with futures.ThreadPoolExecutor(
+            max_workers=_ADS_MAX_WORKERS
+        ) as executor:
+          for results in _map_ahead(
+              executor,
+              self.google_ads_service.retrieve_all_campaigns,
+              _get_customer_ids(results),
+          ):
+            account_map = self.update_sheet_lists(
+                results,
+                data_references.SheetNames.campaigns,
+                "!D:D",
+                account_map,
+                campaign_ids,
+            )
+      finally:
+        self.flush_update_requests()
 
     return account_map
 
   def refresh_asset_group_list(self) -> None:
     """Update spreadsheet with Asset Group list."""
-    results = self.google_ads_service.retrieve_all_customers(
-        self.login_customer_id, self.customer_id_inclusion_list
-    )
-    account_map = self.refresh_campaign_list()
-
-    for row in results:
-      customer_id = str(row.customer_client.id)
-
-      if customer_id:
-        results = self.google_ads_service.retrieve_all_asset_groups(customer_id)
-        self.update_sheet_lists(
-            results,
-            data_references.SheetNames.asset_groups,
-            "!F:F",
-            account_map,
-        )
+    results = self._retrieve_customers()
+    # The id columns of all lists are read with one request, later reads of
+    # them are served from the read cache.
+    with self.cached_reads():
+      existing_values = self.batch_get_sheet_values(
+          [_CUSTOMER_IDS_RANGE, _CAMPAIGN_IDS_RANGE, _ASSET_GROUP_IDS_RANGE]
+      )
+      asset_group_ids = _get_column_values(
+          existing_values[_ASSET_GROUP_IDS_RANGE]
+      )
+      account_map = self.refresh_campaign_list(results)
+
+      # New rows are queued and written with one request.
+      try:
+        with futures.ThreadPoolExecutor(
+            max_workers=_ADS_MAX_WORKERS
+        ) as executor:
+          for results in _map_ahead(
+              executor,
+              self.google_ads_service.retrieve_all_asset_groups,
+              _get_customer_ids(results),
+          ):
+            self.update_sheet_lists(
+                results,
+                data_references.SheetNames.asset_groups,
+                "!F:F",
+                account_map,
+                asset_group_ids,
+            )
+      finally:
+        self.flush_update_requests()
 
   def refresh_assets_list(self) -> None:
     """Update spreadsheet with Assets list."""
     account_map = {}
-    results = self.google_ads_service.retrieve_all_customers(
-        self.login_customer_id, self.customer_id_inclusion_list
-    )
-    account_map = self.update_sheet_lists(
-        results, data_references.SheetNames.customers, "!B:B", account_map
-    )
-
-    for row in results:
-      customer_id = str(row.customer_client.id)
+    results = self._retrieve_customers()
+    # The customer ids and the asset resource names are read with one
+    # request, later reads of them are served from the read cache.
+    with self.cached_reads():
+      existing_values = self.batch_get_sheet_values(
+          [_CUSTOMER_IDS_RANGE, _ASSET_RESOURCE_RANGE]
+      )
+      existing_resource_names = _get_column_values(
+          existing_values[_ASSET_RESOURCE_RANGE]
+      )
 
-      if customer_id:
-        results = self.google_ads_service.retrieve_all_assets(customer_id)
-        self.update_asset_sheet_output(results, account_map)
+      # New customer rows and column formats of new rows are queued, and
+      # written with one request each.
+      try:
+        account_map = self.update_sheet_lists(
+            results, data_references.SheetNames.customers, "!B:B", account_map
+        )
+        with futures.ThreadPoolExecutor(
+            max_workers=_ADS_MAX_WORKERS
+        ) as executor:
+          for results in _map_ahead(
+              executor,
+              self.google_ads_service.retrieve_all_assets,
+              _get_customer_ids(results),
+          ):
+            self.update_asset_sheet_output(
+                results, account_map, existing_resource_names
+            )
+      finally:
+        self.flush_update_requests()
 
   def refresh_sitelinks_list(self) -> None:
     """Update spreadsheet with Sitelinks list."""
     account_map = {}
-    results = self.google_ads_service.retrieve_all_customers(
-        self.login_customer_id, self.customer_id_inclusion_list
-    )
-    account_map = self.update_sheet_lists(
-        results, data_references.SheetNames.customers, "!B:B", account_map
-    )
-
-    for row in results:
-      customer_id = str(row.customer_client.id)
+    results = self._retrieve_customers()
+    # The customer ids and the sitelink resource names are read with one
+    # request, later reads of them are served from the read cache.
+    with self.cached_reads():
+      existing_values = self.batch_get_sheet_values(
+          [_CUSTOMER_IDS_RANGE, _SITELINK_RESOURCE_RANGE]
+      )
+      existing_resource_names = _get_column_values(
+          existing_values[_SITELINK_RESOURCE_RANGE]
+      )
 
-      if customer_id:
-        results = self.google_ads_service.retrieve_sitelinks(customer_id)
-        self.update_sitelink_sheet_output(results, account_map)
+      # New customer rows and column formats of new rows are queued, and
+      # written with one request each.
+      try:
+        account_map = self.update_sheet_lists(
+            results, data_references.SheetNames.customers, "!B:B", account_map
+        )
+        with futures.ThreadPoolExecutor(
+            max_workers=_ADS_MAX_WORKERS
+        ) as executor:
+          for results in _map_ahead(
+              executor,
+              self.google_ads_service.retrieve_sitelinks,
+              _get_customer_ids(results),
+          ):
+            self.update_sitelink_sheet_output(
+                results, account_map, existing_resource_names
+            )
+      finally:
+        self.flush_update_requests()
 
   def refresh_customer_id_list(self) -> None:
     """Update spreadsheet with customer id list."""
-    results = self.google_ads_service.retrieve_all_customers(
-        self.login_customer_id, self.customer_id_inclusion_list
-    )
-    self.update_sheet_lists(
-        results, data_references.SheetNames.customers, "!B:B", {}
-    )
-
-    self._set_cell_value(
-        "=SORT(UNIQUE({CustomerList!$A$5:$A}))", "DropDownConfig!N3"
-    )
+    results = self._retrieve_customers()
+    try:
+      self.update_sheet_lists(
+          results, data_references.SheetNames.customers, "!B:B", {}
+      )
+      self.queue_customer_dropdown_update()
+    finally:
+      self.flush_update_requests()
 
   def update_sheet_lists(
       self,
@@ -1052,64 +1823,40 @@ class SheetsService:
       sheet_name: str,
       column: str,
       account_map: Mapping[str, Mapping[str, str]],
+      existing_ids: set[str] | None = None,
   ) -> Mapping[str, Mapping[str, str]]:
     """Write exisitng customer list, campaigns, asset groups, assets and sitelinks to spreadsheet.
 
+    The new rows are queued and appended by flush_update_requests, together
+    with the rows of the other customers of the same refresh.
+
     Args:
       results: Array of array containing the existing asset groups in Google
         Ads.
       sheet_name: Name of the sheet to write the results to.
       column: String value representation of sheet column, with unique id.
       account_map: Google Ads account map, account ids and names.
+      existing_ids: Ids of the rows already in the sheet, read from the sheet
+        if None. The ids of the written rows are added to it, so it can be
+        reused for the next update.
     """
-    existing_values = self.get_sheet_values(sheet_name + column)
-    sheet_range = ""
+    if existing_ids is None:
+      existing_ids = _get_column_values(
+          self.get_sheet_values(sheet_name + column)
+      )
+    add_to_account_map, list_range = _SHEET_LIST_HANDLERS[sheet_name]
+    sheet_range = sheet_name + "!" + list_range
     sheet_output = []
-    index = 0
     for row in results:
-      if sheet_name == data_references.SheetNames.customers:
-        if row.customer_client.descriptive_name not in account_map:
-          account_map[row.customer_client.descriptive_name] = {}
-        row_item_id = str(row.customer_client.id)
-        sheet_range = sheet_name + "!A:B"
-      elif sheet_name == data_references.SheetNames.campaigns:
-        if row.campaign.name not in account_map[row.customer.descriptive_name]:
-          account_map[row.customer.descriptive_name][row.campaign.name] = []
-        row_item_id = str(row.campaign.id)
-        sheet_range = sheet_name + "!A:D"
-      elif sheet_name == data_references.SheetNames.asset_groups:
-        if (
-            row.asset_group.name
-            not in account_map[row.customer.descriptive_name][row.campaign.name]
-        ):
-          account_map[row.customer.descriptive_name][row.campaign.name].append(
-              row.asset_group.name
-          )
-        row_item_id = str(row.asset_group.id)
-        sheet_range = sheet_name + "!A:F"
-
-      if [row_item_id] not in existing_values:
-        sheet_output.append([])
-        sheet_output[index] = self.generate_list_sheet_output(row, sheet_name)
-
-        index += 1
+      row_item_id = add_to_account_map(row, account_map)
 
-    value_input_option = "USER_ENTERED"
-    insert_data_option = "INSERT_ROWS"
-    value_range_body = {"values": sheet_output}
+      if row_item_id not in existing_ids:
+        existing_ids.add(row_item_id)
+        sheet_output.append(self.generate_list_sheet_output(row, sheet_name))
 
-    try:
-      request = self._sheets_service.values().append(
-          spreadsheetId=self.spread_sheet_id,
-          range=sheet_range,
-          valueInputOption=value_input_option,
-          insertDataOption=insert_data_option,
-          body=value_range_body,
-      )
-      request.execute()
-    except errors.HttpError as e:
-      logging.error("Unable to update Sheet rows: %s ", str(e))
-      raise e
+    # Nothing new since the last refresh, skip the no-op write.
+    if sheet_output:
+      self._pending_rows.setdefault(sheet_range, []).extend(sheet_output)
 
     return account_map
 
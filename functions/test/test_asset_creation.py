@@ -55,7 +55,7 @@ class TestAssetService(unittest.TestCase):
     input_sheet_row = ["", "true", "customer1", "test_camapign", "AssetGroup1"]
     result = self.asset_service.compile_asset_group_alias(input_sheet_row)
 
-    self.assertEqual(result, "customer1;test_camapign;AssetGroup1")
+    self.assertEqual(result, ("customer1", "test_camapign", "AssetGroup1"))
 
   def test_compile_asset_group_alias_return_none_when_no_data(self):
     input_sheet_row = ["", "true", "customer1", "test_camapign"]
@@ -184,7 +184,7 @@ class TestAssetService(unittest.TestCase):
       mock_create_asset,
   ):
     mock_compile_asset_group_alias.return_value = (
-        "TestAccount;ThisisaCampaign;TestAGN"
+        "TestAccount", "ThisisaCampaign", "TestAGN"
     )
     test_asset_group_data = [
         "Test Account",
@@ -194,7 +194,9 @@ class TestAssetService(unittest.TestCase):
         "AGN",
         "AGI",
     ]
-    self.sheet_service.get_sheet_row.return_value = test_asset_group_data
+    self.sheet_service.get_sheet_index.return_value = {
+        ("TestAccount", "ThisisaCampaign", "TestAGN"): test_asset_group_data
+    }
     test_asset_group_asset_operation = {"service": "AssetGroupService"}
     mock_add_asset_to_asset_group.return_value = (
         test_asset_group_asset_operation
@@ -242,6 +244,93 @@ class TestAssetService(unittest.TestCase):
     ):
       self.asset_service.upload_assets_to_sheet(operations, {}, ["Test"])
 
+  def test_upload_asset_to_sheet_writes_results_before_raising_error(self):
+    self.google_ads_service.bulk_mutate.side_effect = (
+        lambda batch, customer_id, _: (None, "Attention! Error!")
+        if customer_id == "Customer ID 1"
+        else ("Response", None)
+    )
+    self.google_ads_service.process_asset_results.return_value = {
+        0: {"status": "UPLOADED", "message": "", "asset_group_asset": "a/1"}
+    }
+    operations = {"Customer ID 1": ["Test"], "Customer ID 2": ["Test"]}
+
+    with self.assertRaisesRegex(ValueError, "Attention! Error!"):
+      self.asset_service.upload_assets_to_sheet(operations, {}, {})
+
+    self.sheet_service.bulk_update_sheet_status.assert_called_once_with(
+        data_references.SheetNames.assets,
+        data_references.Assets.status,
+        data_references.Assets.error_message,
+        data_references.Assets.asset_group_asset,
+        {0: {"status": "UPLOADED", "message": "", "asset_group_asset": "a/1"}},
+    )
+
+  def test_upload_asset_to_sheet_splits_operations_into_batches(self):
+    self.google_ads_service.bulk_mutate.return_value = ("Response", None)
+    self.google_ads_service.process_asset_results.return_value = {}
+    operations = {"Customer ID 1": list(range(1200))}
+
+    self.asset_service.upload_assets_to_sheet(operations, {}, {})
+
+    self.google_ads_service.bulk_mutate.assert_has_calls([
+        mock.call(list(range(1000)), "Customer ID 1", True),
+        mock.call(list(range(1000, 1200)), "Customer ID 1", True),
+    ])
+
+  @mock.patch("requests.get")
+  def test_prefetch_images_downloads_only_image_assets_once(
+      self, mock_requests_get
+  ):
+    mock_requests_get.return_value.content = b"image"
+
+    self.asset_service.prefetch_images([
+        (data_references.AssetTypes.marketing_image, "https://example.com/1"),
+        (data_references.AssetTypes.headline, "https://example.com/2"),
+        (data_references.AssetTypes.square_logo, "not a url"),
+    ])
+    result = self.asset_service.create_image_asset(
+        "https://example.com/1", "Test Image Asset", "customer10"
+    )
+
+    mock_requests_get.assert_called_once_with("https://example.com/1")
+    self.assertEqual(result.asset_operation.create.image_asset.data, b"image")
+
+  @mock.patch("requests.get")
+  def test_create_image_asset_reuses_prefetched_image_for_shared_url(
+      self, mock_requests_get
+  ):
+    mock_requests_get.return_value.content = b"image"
+
+    self.asset_service.prefetch_images([
+        (data_references.AssetTypes.marketing_image, "https://example.com/1"),
+        (data_references.AssetTypes.square_image, "https://example.com/1"),
+    ])
+    self.asset_service.create_image_asset(
+        "https://example.com/1", "Test Image Asset", "customer10"
+    )
+    self.asset_service.create_image_asset(
+        "https://example.com/1", "Test Image Asset", "customer10"
+    )
+
+    mock_requests_get.assert_called_once_with("https://example.com/1")
+
+  @mock.patch("requests.get")
+  def test_clear_prefetched_images_drops_downloaded_images(
+      self, mock_requests_get
+  ):
+    mock_requests_get.return_value.content = b"image"
+
+    self.asset_service.prefetch_images([
+        (data_references.AssetTypes.marketing_image, "https://example.com/1"),
+    ])
+    self.asset_service.clear_prefetched_images()
+    self.asset_service.create_image_asset(
+        "https://example.com/1", "Test Image Asset", "customer10"
+    )
+
+    self.assertEqual(mock_requests_get.call_count, 2)
+
 
 if __name__ == "__main__":
   unittest.main()
@@ -148,7 +148,7 @@ class TestAssetGroupService(unittest.TestCase):
     ]
     result = self.asset_group_service.compile_campaign_alias(input_sheet_row)
 
-    self.assertEqual(result, "customer1;test_camapign")
+    self.assertEqual(result, ("customer1", "test_camapign"))
 
   @mock.patch("validators.url")
   def test_create_asset_group_return_error_on_invalid_url(
@@ -362,10 +362,9 @@ class TestAssetGroupService(unittest.TestCase):
         "asset/group/name/1",
         ["Test AN", "12345", "Test Campaign 1", "Campaign id"],
     )
-    mock_create_mandatory_text_assets.assert_has_calls([
-        mock.call(["Text 1", "Text 2", "Text 3"], "12345"),
-        mock.call(["Text 4", "Text 5"], "12345"),
-    ])
+    mock_create_mandatory_text_assets.assert_called_once_with(
+        ["Text 1", "Text 2", "Text 3", "Text 4", "Text 5"], "12345"
+    )
 
   @mock.patch(
       "asset_group_creation.AssetGroupService.create_other_assets_asset_group"
@@ -384,7 +383,7 @@ class TestAssetGroupService(unittest.TestCase):
       mock_consolidate_mandatory_assets_group_operations,
       mock_create_other_assets_asset_group,
   ):
-    mock_create_mandatory_text_assets.return_value = ["A", "b", "C"]
+    mock_create_mandatory_text_assets.return_value = ["A", "b", "C", "D", "e"]
     mock_consolidate_mandatory_assets_group_operations.return_value = [
         {"Test": "test"}
     ]
@@ -398,7 +397,41 @@ class TestAssetGroupService(unittest.TestCase):
     )
     mock_consolidate_mandatory_assets_group_operations.assert_has_calls([
         mock.call(["A", "b", "C"], "HEADLINE", "asset/id/1", "12345"),
-        mock.call(["A", "b", "C"], "DESCRIPTION", "asset/id/1", "12345"),
+        mock.call(["D", "e"], "DESCRIPTION", "asset/id/1", "12345"),
+    ])
+
+  @mock.patch(
+      "asset_group_creation.AssetGroupService.create_other_assets_asset_group"
+  )
+  @mock.patch(
+      "asset_group_creation.AssetGroupService.consolidate_mandatory_assets_group_operations"
+  )
+  @mock.patch(
+      "asset_group_creation.AssetGroupService.create_mandatory_text_assets"
+  )
+  @mock.patch("asset_group_creation.AssetGroupService.create_asset_group")
+  def test_generate_mandatory_assets_for_asset_group_keeps_created_text_assets_on_partial_failure(
+      self,
+      mock_create_asset_group,
+      mock_create_mandatory_text_assets,
+      mock_consolidate_mandatory_assets_group_operations,
+      mock_create_other_assets_asset_group,
+  ):
+    mock_create_mandatory_text_assets.return_value = [
+        "A", None, "C", "D", None
+    ]
+    mock_consolidate_mandatory_assets_group_operations.return_value = []
+    mock_create_other_assets_asset_group.return_value = []
+    mock_create_asset_group.return_value = [{"Test3": "test3"}]
+    self.asset_group_service.generate_mandatory_assets_for_asset_group(
+        self.test_asset_group_row,
+        "asset/id/1",
+        "asset/group/name/1",
+        ["Test AN", "12345", "Test Campaign 1", "Campaign id"],
+    )
+    mock_consolidate_mandatory_assets_group_operations.assert_has_calls([
+        mock.call(["A", "C"], "HEADLINE", "asset/id/1", "12345"),
+        mock.call(["D"], "DESCRIPTION", "asset/id/1", "12345"),
     ])
 
   @mock.patch(
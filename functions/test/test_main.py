@@ -312,6 +312,19 @@ class TestMain(unittest.TestCase):
     mock_refresh_assets_list.assert_not_called()
     mock_refresh_sitelinks_list.assert_not_called()
 
+  @patch('main._get_credentials')
+  @patch('main._get_google_ads_client')
+  @patch('main._load_config')
+  def test_get_pubsub_builds_a_new_instance_per_invocation(
+      self, mock_load_config, mock_get_google_ads_client, mock_get_credentials
+  ):
+    first = main._get_pubsub()
+    second = main._get_pubsub()
+
+    self.assertIsNot(first, second)
+    self.assertIs(first.google_ads_client, second.google_ads_client)
+    self.assertIs(first.credentials, mock_get_credentials.return_value)
+
   def create_tempdir(self, name: str) -> _TempDir:
     """Create a temporary directory specific to the test.
 
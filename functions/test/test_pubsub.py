@@ -14,7 +14,6 @@
 
 from typing import Final
 import unittest
-from unittest.mock import call
 from unittest.mock import Mock
 from unittest.mock import patch
 from pubsub import PubSub
@@ -49,6 +48,19 @@ def _mock_get_sheet_values_callback(input_value):
     return [["Assets Test Data"]]
 
 
+def _mock_batch_get_sheet_values_callback(input_values):
+  """Mock SheetsService.batch_get_sheet_values function based on the input.
+
+  Args:
+  input_values: Expected input value for SheetsService.batch_get_sheet_values
+    function.
+  """
+  return {
+      input_value: _mock_get_sheet_values_callback(input_value)
+      for input_value in input_values
+  }
+
+
 class TestPubSubCall(unittest.TestCase):
 
   @patch("data_references.ConfigFile")
@@ -127,10 +139,10 @@ class TestPubSubCall(unittest.TestCase):
 
   @patch("asset_creation.AssetService.process_asset_data_and_create")
   @patch("sheet_api.SheetsService.get_sheet_id")
-  @patch("sheet_api.SheetsService.get_sheet_values")
+  @patch("sheet_api.SheetsService.batch_get_sheet_values")
   def test_create_api_operations_calls_value_retrieval_services_correctly(
       self,
-      mock_get_sheet_values,
+      mock_batch_get_sheet_values,
       mock_get_sheet_id,
       mock_process_asset_data_and_create,
   ):
@@ -140,22 +152,19 @@ class TestPubSubCall(unittest.TestCase):
     """
     mock_process_asset_data_and_create.return_value = True
     mock_get_sheet_id.return_value = "1234abcd"
-    mock_get_sheet_values.side_effect = _mock_get_sheet_values_callback
+    mock_batch_get_sheet_values.side_effect = (
+        _mock_batch_get_sheet_values_callback
+    )
     self.pubsub.create_api_operations()
 
-    expected_calls = [
-        call(_SHEET_RANGE_ARGS["new_campaigns_arg"]),
-        call(_SHEET_RANGE_ARGS["sitelinks_arg"]),
-        call(_SHEET_RANGE_ARGS["assets_arg"]),
-        call(_SHEET_RANGE_ARGS["new_asset_groups_arg"]),
-        call(_SHEET_RANGE_ARGS["asset_group_arg"]),
-        call(_SHEET_RANGE_ARGS["campaigns_arg"]),
-    ]
-
-    mock_get_sheet_values.assert_has_calls(expected_calls)
-
-    expected_call_count = 6
-    self.assertTrue(mock_get_sheet_values.call_count >= expected_call_count)
+    mock_batch_get_sheet_values.assert_called_once_with([
+        _SHEET_RANGE_ARGS["new_campaigns_arg"],
+        _SHEET_RANGE_ARGS["sitelinks_arg"],
+        _SHEET_RANGE_ARGS["assets_arg"],
+        _SHEET_RANGE_ARGS["new_asset_groups_arg"],
+        _SHEET_RANGE_ARGS["asset_group_arg"],
+        _SHEET_RANGE_ARGS["campaigns_arg"],
+    ])
 
   @patch("sheet_api.SheetsService.get_sheet_id")
   @patch("sitelink_creation.SitelinkService.process_sitelink_input_sheet")
@@ -166,10 +175,10 @@ class TestPubSubCall(unittest.TestCase):
   @patch(
       "campaign_creation.CampaignService.process_campaign_input_sheet"
   )
-  @patch("sheet_api.SheetsService.get_sheet_values")
+  @patch("sheet_api.SheetsService.batch_get_sheet_values")
   def test_create_api_operations_calls_services_correctly(
       self,
-      mock_get_sheet_values,
+      mock_batch_get_sheet_values,
       mock_process_campaign_input_sheet,
       mock_process_asset_group_data_and_create,
       mock_process_asset_data_and_create,
@@ -181,7 +190,9 @@ class TestPubSubCall(unittest.TestCase):
     Confirms if service calls correct functions with all data available.
     """
     mock_get_sheet_id.return_value = "1234abcd"
-    mock_get_sheet_values.side_effect = _mock_get_sheet_values_callback
+    mock_batch_get_sheet_values.side_effect = (
+        _mock_batch_get_sheet_values_callback
+    )
     self.pubsub.create_api_operations()
 
     mock_process_campaign_input_sheet.assert_called_with(
@@ -205,10 +216,10 @@ class TestPubSubCall(unittest.TestCase):
   @patch(
       "campaign_creation.CampaignService.process_campaign_input_sheet"
   )
-  @patch("sheet_api.SheetsService.get_sheet_values")
+  @patch("sheet_api.SheetsService.batch_get_sheet_values")
   def test_create_api_operations_dont_call_asset_group_service(
       self,
-      mock_get_sheet_values,
+      mock_batch_get_sheet_values,
       mock_process_campaign_input_sheet,
       mock_process_asset_group_data_and_create,
       mock_process_asset_data_and_create,
@@ -218,10 +229,67 @@ class TestPubSubCall(unittest.TestCase):
 
     Confirms if service ignores assets creation when no data available.
     """
-    mock_get_sheet_values.return_value = None
+    mock_batch_get_sheet_values.side_effect = lambda input_values: {
+        input_value: [] for input_value in input_values
+    }
     self.pubsub.create_api_operations()
 
     mock_process_campaign_input_sheet.assert_not_called()
     mock_process_asset_group_data_and_create.assert_not_called()
     mock_process_sitelink_input_sheet.assert_not_called()
     mock_process_asset_data_and_create.assert_not_called()
+
+  @patch("sheet_api.SheetsService.flush_update_requests")
+  @patch("sheet_api.SheetsService.get_sheet_id")
+  @patch("asset_creation.AssetService.process_asset_data_and_create")
+  @patch("sheet_api.SheetsService.batch_get_sheet_values")
+  def test_create_api_operations_flushes_status_updates_on_error(
+      self,
+      mock_batch_get_sheet_values,
+      mock_process_asset_data_and_create,
+      mock_get_sheet_id,
+      mock_flush_update_requests,
+  ):
+    """Test create_api_operations method in PubSub.
+
+    Confirms queued status updates are written even if a service fails.
+    """
+    mock_get_sheet_id.return_value = "1234abcd"
+    mock_batch_get_sheet_values.side_effect = (
+        _mock_batch_get_sheet_values_callback
+    )
+    mock_process_asset_data_and_create.side_effect = ValueError("Error")
+
+    with self.assertRaises(ValueError):
+      self.pubsub.create_api_operations()
+
+    mock_flush_update_requests.assert_called_once()
+
+  @patch("sheet_api.SheetsService.flush_update_requests")
+  @patch("sitelink_creation.SitelinkService.process_sitelink_input_sheet")
+  @patch("campaign_creation.CampaignService.process_campaign_input_sheet")
+  @patch("sheet_api.SheetsService.batch_get_sheet_values")
+  def test_create_api_operations_returns_early_without_input_rows(
+      self,
+      mock_batch_get_sheet_values,
+      mock_process_campaign_input_sheet,
+      mock_process_sitelink_input_sheet,
+      mock_flush_update_requests,
+  ):
+    """Test create_api_operations method in PubSub.
+
+    Confirms if service skips all processing when the input sheets are empty.
+    """
+    mock_batch_get_sheet_values.side_effect = lambda input_values: {
+        input_value: (
+            [["Campaigns Test Data"]]
+            if input_value == _SHEET_RANGE_ARGS["campaigns_arg"]
+            else []
+        )
+        for input_value in input_values
+    }
+    self.pubsub.create_api_operations()
+
+    mock_process_campaign_input_sheet.assert_not_called()
+    mock_process_sitelink_input_sheet.assert_not_called()
+    mock_flush_update_requests.assert_not_called()
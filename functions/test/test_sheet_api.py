@@ -16,6 +16,10 @@
 from collections import namedtuple
 import unittest
 from unittest import mock
+import data_references
+from googleapiclient import errors
+import httplib2
+import sheet_api
 from sheet_api import SheetsService
 
 
@@ -43,6 +47,9 @@ class TestSheetService(unittest.TestCase):
         ResultRow(customer_client=Customer(id="customer2")),
     ]
     mock_update_asset_sheet_output.return_value = None
+    self.sheet_service.batch_get_sheet_values = mock.Mock(
+        side_effect=lambda cell_ranges: {r: [] for r in cell_ranges}
+    )
 
     self.google_ads_service.retrieve_all_customers.return_value = (
         retrieve_all_customers
@@ -54,7 +61,7 @@ class TestSheetService(unittest.TestCase):
 
     self.sheet_service.refresh_assets_list()
     self.google_ads_service.retrieve_all_assets.assert_has_calls(
-        [mock.call("customer1"), mock.call("customer2")]
+        [mock.call("customer1"), mock.call("customer2")], any_order=True
     )
 
   @mock.patch("sheet_api.SheetsService.update_asset_sheet_output")
@@ -89,10 +96,795 @@ class TestSheetService(unittest.TestCase):
     }
     mock_update_sheet_lists.return_value = account_map
     self.google_ads_service.retrieve_all_assets.return_value = refresh_results
+    self.sheet_service.batch_get_sheet_values = mock.Mock(
+        return_value={
+            sheet_api._CUSTOMER_IDS_RANGE: [],
+            sheet_api._ASSET_RESOURCE_RANGE: [["Resource"], ["resource_name1"]],
+        }
+    )
 
     self.sheet_service.refresh_assets_list()
 
+    existing_resource_names = {"Resource", "resource_name1"}
     mock_update_asset_sheet_output.assert_has_calls([
-        mock.call(refresh_results, account_map),
-        mock.call(refresh_results, account_map),
-    ])
\ No newline at end of file
+        mock.call(refresh_results, account_map, existing_resource_names),
+        mock.call(refresh_results, account_map, existing_resource_names),
+    ])
+    self.sheet_service.batch_get_sheet_values.assert_called_once_with(
+        [sheet_api._CUSTOMER_IDS_RANGE, sheet_api._ASSET_RESOURCE_RANGE]
+    )
+
+  def test_get_sheet_index_maps_row_keys_to_first_matching_row(self):
+    campaign_data = [
+        ["Customer1", "111", "Campaign1", "1"],
+        ["Customer1", "111", "Campaign2", "2"],
+        ["Customer1", "111", "Campaign1", "3"],
+        ["Customer2"],
+    ]
+
+    result = self.sheet_service.get_sheet_index(
+        campaign_data, data_references.SheetNames.campaigns
+    )
+
+    self.assertEqual(
+        result,
+        {
+            ("Customer1", "Campaign1"): campaign_data[0],
+            ("Customer1", "Campaign2"): campaign_data[1],
+        },
+    )
+
+  def test_get_sheet_row_returns_matching_row_or_none(self):
+    customer_data = [["Customer1", "111"], ["Customer2", "222"]]
+
+    self.assertEqual(
+        self.sheet_service.get_sheet_row(
+            "Customer2", customer_data, data_references.SheetNames.customers
+        ),
+        customer_data[1],
+    )
+    self.assertIsNone(
+        self.sheet_service.get_sheet_row(
+            "Customer3", customer_data, data_references.SheetNames.customers
+        )
+    )
+
+  def test_variable_update_sheet_status_writes_resource_name(self):
+    self.sheet_service.variable_update_sheet_status(
+        0,
+        "sheet1",
+        1,
+        data_references.RowStatus.uploaded,
+        "",
+        2,
+        "customers/1/assets/2",
+        3,
+    )
+
+    written_cells = [
+        (
+            request["updateCells"]["start"]["columnIndex"],
+            request["updateCells"]["rows"][0]["values"][0]["userEnteredValue"][
+                "stringValue"
+            ],
+        )
+        for request in self.sheet_service._pending_requests
+    ]
+    self.assertEqual(
+        written_cells,
+        [
+            (1, data_references.RowStatus.uploaded),
+            (2, ""),
+            (3, "customers/1/assets/2"),
+        ],
+    )
+
+  @mock.patch("sheet_api.SheetsService.batch_update_requests")
+  def test_status_updates_are_sent_in_one_batch_on_flush(
+      self, mock_batch_update_requests
+  ):
+    self.sheet_service.variable_update_sheet_status(
+        0, "sheet1", 1, data_references.RowStatus.error, "Error", 2
+    )
+    self.sheet_service.variable_update_sheet_status(
+        1, "sheet1", 1, data_references.RowStatus.uploaded, "", 2
+    )
+    mock_batch_update_requests.assert_not_called()
+
+    self.sheet_service.flush_update_requests()
+    self.sheet_service.flush_update_requests()
+
+    mock_batch_update_requests.assert_called_once()
+    update_requests = mock_batch_update_requests.call_args.args[0]
+    self.assertEqual(
+        [
+            (
+                request["updateCells"]["start"]["rowIndex"],
+                request["updateCells"]["start"]["columnIndex"],
+                [
+                    row["values"][0]["userEnteredValue"]["stringValue"]
+                    for row in request["updateCells"]["rows"]
+                ],
+            )
+            for request in update_requests
+        ],
+        [
+            (
+                sheet_api._SHEET_HEADER_SIZE,
+                1,
+                [data_references.RowStatus.error,
+                 data_references.RowStatus.uploaded],
+            ),
+            (sheet_api._SHEET_HEADER_SIZE, 2, ["Error", ""]),
+        ],
+    )
+
+  def test_merge_cell_updates_keeps_order_around_other_requests(self):
+    first = self.sheet_service.get_status_note(5, 1, "a", "sheet1")
+    second = self.sheet_service.get_status_note(6, 1, "b", "sheet1")
+    rewrite = self.sheet_service.get_status_note(5, 1, "c", "sheet1")
+    checkbox = self.sheet_service.get_checkbox(5, 2, "sheet1")
+
+    merged_requests = sheet_api._merge_cell_updates(
+        [first, second, checkbox, rewrite]
+    )
+
+    self.assertEqual(
+        merged_requests,
+        [
+            self.sheet_service.get_status_notes(
+                5, 1, [["a"], ["b"]], "sheet1"
+            ),
+            checkbox,
+            rewrite,
+        ],
+    )
+
+  @mock.patch("sheet_api.SheetsService.batch_update_requests")
+  def test_failed_append_sends_statuses_and_clears_the_queues(
+      self, mock_batch_update_requests
+  ):
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    sheets_service.values().append().execute.side_effect = errors.HttpError(
+        httplib2.Response({"status": 500}), b""
+    )
+    self.sheet_service.add_new_campaign_to_list_sheet(["Campaign 1"])
+    self.sheet_service.variable_update_sheet_status(
+        0, "sheet1", 1, data_references.RowStatus.uploaded
+    )
+
+    with self.assertRaises(errors.HttpError):
+      self.sheet_service.flush_update_requests()
+    self.sheet_service.flush_update_requests()
+
+    sheets_service.values().append().execute.assert_called_once()
+    mock_batch_update_requests.assert_called_once()
+    self.assertEqual(len(mock_batch_update_requests.call_args.args[0]), 1)
+
+  @mock.patch("sheet_api.SheetsService.batch_update_requests")
+  def test_failed_append_is_raised_when_batch_update_fails_too(
+      self, mock_batch_update_requests
+  ):
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    append_error = errors.HttpError(httplib2.Response({"status": 500}), b"")
+    update_error = errors.HttpError(httplib2.Response({"status": 503}), b"")
+    sheets_service.values().append().execute.side_effect = append_error
+    mock_batch_update_requests.side_effect = update_error
+    self.sheet_service.add_new_campaign_to_list_sheet(["Campaign 1"])
+    self.sheet_service.variable_update_sheet_status(
+        0, "sheet1", 1, data_references.RowStatus.uploaded
+    )
+
+    with self.assertRaises(errors.HttpError) as context:
+      self.sheet_service.flush_update_requests()
+
+    self.assertIs(context.exception, append_error)
+    self.assertIs(context.exception.__cause__, update_error)
+
+  @mock.patch("sheet_api.SheetsService.get_sheet_id")
+  def test_bulk_update_sheet_status_coalesces_adjacent_cells(
+      self, mock_get_sheet_id
+  ):
+    mock_get_sheet_id.return_value = "sheet1"
+    results = {
+        row: {
+            "status": f"status{row}",
+            "message": f"message{row}",
+            "asset_group_asset": f"resource{row}",
+        }
+        for row in (0, 1, 3)
+    }
+
+    self.sheet_service.bulk_update_sheet_status("Assets", 0, 10, 11, results)
+    self.sheet_service.batch_update_requests = mock.Mock()
+    self.sheet_service.flush_update_requests()
+
+    requests = self.sheet_service.batch_update_requests.call_args.args[0]
+    self.assertEqual(
+        [
+            (
+                request["updateCells"]["start"]["rowIndex"],
+                request["updateCells"]["start"]["columnIndex"],
+                [
+                    [v["userEnteredValue"]["stringValue"] for v in r["values"]]
+                    for r in request["updateCells"]["rows"]
+                ],
+            )
+            for request in requests
+        ],
+        [
+            (5, 0, [["status0"], ["status1"]]),
+            (5, 10, [["message0", "resource0"], ["message1", "resource1"]]),
+            (8, 0, [["status3"]]),
+            (8, 10, [["message3", "resource3"]]),
+        ],
+    )
+
+  @mock.patch("sheet_api.SheetsService.get_sheet_values")
+  def test_update_sheet_lists_skips_append_when_nothing_is_new(
+      self, mock_get_sheet_values
+  ):
+    Customer = namedtuple("Customer", ["id", "descriptive_name"])
+    ResultRow = namedtuple("ResultRow", ["customer_client"])
+    results = [
+        ResultRow(customer_client=Customer(id=1, descriptive_name="Name1")),
+    ]
+    mock_get_sheet_values.return_value = [["1"]]
+    self.sheet_service._sheets_service = mock.MagicMock()
+
+    account_map = self.sheet_service.update_sheet_lists(
+        results, data_references.SheetNames.customers, "!B:B", {}
+    )
+
+    self.assertEqual(account_map, {"Name1": {}})
+    self.sheet_service._sheets_service.values().append.assert_not_called()
+
+  @mock.patch("sheet_api.SheetsService.get_sheet_values")
+  def test_update_sheet_lists_uses_and_updates_given_existing_ids(
+      self, mock_get_sheet_values
+  ):
+    Customer = namedtuple("Customer", ["id", "descriptive_name"])
+    ResultRow = namedtuple("ResultRow", ["customer_client"])
+    results = [
+        ResultRow(customer_client=Customer(id=2, descriptive_name="Name2")),
+    ]
+    existing_ids = {"1"}
+
+    self.sheet_service.update_sheet_lists(
+        results, data_references.SheetNames.customers, "!B:B", {}, existing_ids
+    )
+
+    mock_get_sheet_values.assert_not_called()
+    self.assertEqual(len(existing_ids), 2)
+
+  @mock.patch("sheet_api.SheetsService.get_sheet_values")
+  def test_update_sheet_lists_appends_rows_of_all_customers_on_flush(
+      self, mock_get_sheet_values
+  ):
+    Customer = namedtuple("Customer", ["id", "descriptive_name"])
+    Campaign = namedtuple("Campaign", ["id", "name"])
+    ResultRow = namedtuple("ResultRow", ["customer", "campaign"])
+    mock_get_sheet_values.return_value = [["1"]]
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    append_request = sheets_service.values().append
+    append_request.reset_mock()
+    account_map = {"Name1": {}, "Name2": {}}
+
+    for customer_id, campaign_id in ((1, 1), (1, 2), (2, 3)):
+      customer = Customer(customer_id, f"Name{customer_id}")
+      campaign = Campaign(campaign_id, f"Campaign{campaign_id}")
+      self.sheet_service.update_sheet_lists(
+          [ResultRow(customer, campaign)],
+          data_references.SheetNames.campaigns,
+          "!D:D",
+          account_map,
+      )
+    append_request.assert_not_called()
+
+    self.sheet_service.flush_update_requests()
+
+    append_request.assert_called_once()
+    self.assertEqual(
+        [
+            row[data_references.CampaignList.campaign_id]
+            for row in append_request.call_args.kwargs["body"]["values"]
+        ],
+        [2, 3],
+    )
+
+  def test_batch_get_sheet_values_maps_values_to_requested_ranges(self):
+    sheets_service = mock.MagicMock()
+    sheets_service.values().batchGet().execute.return_value = {
+        "valueRanges": [
+            {"range": "Sheet1!A6:B1000", "values": [["a", "b"]]},
+            {"range": "Sheet2!A6:C1000"},
+        ]
+    }
+    self.sheet_service._sheets_service = sheets_service
+
+    result = self.sheet_service.batch_get_sheet_values(
+        ["Sheet1!A6:B", "Sheet2!A6:C"]
+    )
+
+    self.assertEqual(
+        result, {"Sheet1!A6:B": [["a", "b"]], "Sheet2!A6:C": []}
+    )
+
+  def test_batch_get_sheet_values_rejects_mismatched_ranges(self):
+    sheets_service = mock.MagicMock()
+    sheets_service.values().batchGet().execute.return_value = {
+        "valueRanges": [
+            {"range": "'Sheet 2'!A6:C1000", "values": [["a", "b", "c"]]},
+            {"range": "'Sheet 1'!A6:B1000", "values": [["a", "b"]]},
+        ]
+    }
+    self.sheet_service._sheets_service = sheets_service
+
+    with self.sheet_service.cached_reads():
+      with self.assertRaises(ValueError):
+        self.sheet_service.batch_get_sheet_values(
+            ["Sheet 1!A6:B", "Sheet 2!A6:C"]
+        )
+      self.assertEqual(self.sheet_service._values_cache, {})
+
+  def test_get_sheet_values_reuses_cached_reads_until_sheet_is_written(self):
+    sheets_service = mock.MagicMock()
+    get_request = sheets_service.values().get
+    get_request().execute.return_value = {"values": [["a", "b"]]}
+    get_request.reset_mock()
+    self.sheet_service._sheets_service = sheets_service
+
+    with self.sheet_service.cached_reads():
+      self.sheet_service.get_sheet_values("Sheet1!A6:B")
+      self.sheet_service.get_sheet_values("Sheet1!A6:B")
+      self.assertEqual(get_request.call_count, 1)
+
+      self.sheet_service.add_new_campaign_to_list_sheet(["a", "b"])
+      self.sheet_service.get_sheet_values("Sheet1!A6:B")
+      self.assertEqual(get_request.call_count, 1)
+
+      self.sheet_service.invalidate_range("Sheet1!B7")
+      self.sheet_service.get_sheet_values("Sheet1!A6:B")
+      self.assertEqual(get_request.call_count, 2)
+
+    self.sheet_service.get_sheet_values("Sheet1!A6:B")
+    self.assertEqual(get_request.call_count, 3)
+
+  def test_batch_update_requests_retries_rate_limited_writes(self):
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+
+    self.sheet_service.batch_update_requests([{"updateCells": {}}])
+
+    sheets_service.batchUpdate().execute.assert_called_once_with(
+        http=mock.ANY, num_retries=sheet_api._NUM_RETRIES
+    )
+
+  def test_get_sheet_values_retries_rate_limited_reads(self):
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+
+    self.sheet_service.get_sheet_values("Sheet1!A6:B")
+
+    sheets_service.values().get().execute.assert_called_once_with(
+        http=mock.ANY, num_retries=sheet_api._NUM_RETRIES
+    )
+
+  def test_batch_update_requests_splits_batches_rejected_as_too_large(self):
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    too_large = errors.HttpError(httplib2.Response({"status": 413}), b"")
+    sheets_service.batchUpdate().execute.side_effect = [too_large, {}, {}]
+    requests = [{"updateCells": {"index": i}} for i in range(4)]
+
+    self.sheet_service.batch_update_requests(requests)
+
+    sent_batches = [
+        call.kwargs["body"]["requests"]
+        for call in sheets_service.batchUpdate.call_args_list
+        if call.kwargs
+    ]
+    self.assertEqual(sent_batches, [requests, requests[:2], requests[2:]])
+
+  @mock.patch("sheet_api.SheetsService.batch_update_requests")
+  def test_new_asset_groups_are_appended_in_one_request_on_flush(
+      self, mock_batch_update_requests
+  ):
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    append_request = sheets_service.values().append
+    append_request.reset_mock()
+
+    self.sheet_service.add_new_asset_group_to_list_sheet(["Group 1"])
+    self.sheet_service.add_new_asset_group_to_list_sheet(["Group 2"])
+    append_request.assert_not_called()
+
+    self.sheet_service.flush_update_requests()
+    self.sheet_service.flush_update_requests()
+
+    append_request.assert_called_once()
+    self.assertEqual(
+        append_request.call_args.kwargs["body"]["values"],
+        [["Group 1"], ["Group 2"]],
+    )
+    mock_batch_update_requests.assert_not_called()
+
+  def test_new_campaigns_are_appended_in_one_request_on_flush(self):
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    append_request = sheets_service.values().append
+    append_request.reset_mock()
+
+    self.sheet_service.add_new_campaign_to_list_sheet(["Campaign 1"])
+    self.sheet_service.add_new_campaign_to_list_sheet(["Campaign 2"])
+    append_request.assert_not_called()
+
+    self.sheet_service.flush_update_requests()
+
+    append_request.assert_called_once()
+    self.assertEqual(
+        append_request.call_args.kwargs["body"]["values"],
+        [["Campaign 1"], ["Campaign 2"]],
+    )
+
+  @mock.patch("sheet_api.SheetsService.batch_update_requests")
+  @mock.patch("sheet_api.SheetsService.get_sheet_id")
+  def test_sitelink_columns_are_sorted_once_after_all_updates(
+      self, mock_get_sheet_id, mock_batch_update_requests
+  ):
+    mock_get_sheet_id.return_value = 1
+    response = {"tableRange": "Sitelinks!A5:J10", "updates": {"updatedRows": 1}}
+    sheet_row = [""] * 10
+    sheet_row[data_references.Sitelinks.customer_name] = "Customer1"
+    sheet_row[data_references.Sitelinks.campaign_name] = "Campaign1"
+    sheet_output = [sheet_row]
+    account_map = {"Customer1": {"Campaign1": []}}
+
+    self.sheet_service.update_sitelinks_columns(
+        response, sheet_output, account_map
+    )
+    self.sheet_service.update_sitelinks_columns(
+        response, sheet_output, account_map
+    )
+    mock_batch_update_requests.assert_not_called()
+
+    self.sheet_service.flush_update_requests()
+
+    mock_batch_update_requests.assert_called_once()
+    update_request_list = mock_batch_update_requests.call_args.args[0]
+    self.assertEqual(
+        ["sortRange" in request for request in update_request_list],
+        [False] * 6 + [True],
+    )
+
+  def test_get_sheet_id_by_name_fetches_sheet_ids_once(self):
+    sheets_service = mock.MagicMock()
+    get_request = sheets_service.get
+    get_request().execute.return_value = {
+        "sheets": [
+            {"properties": {"title": "Assets", "sheetId": 1}},
+            {"properties": {"title": "Sitelinks", "sheetId": 2}},
+        ]
+    }
+    get_request.reset_mock()
+    self.sheet_service._sheets_service = sheets_service
+
+    self.assertEqual(self.sheet_service.get_sheet_id_by_name("Assets"), 1)
+    self.assertEqual(self.sheet_service.get_sheet_id_by_name("Sitelinks"), 2)
+    self.assertEqual(self.sheet_service.get_sheet_id_by_name("Assets"), 1)
+
+    get_request.assert_called_once()
+
+  def test_get_sheet_range_index_reuses_index_of_cached_values(self):
+    customer_data = [["Customer1", "1"], ["Customer2", "2"]]
+
+    get_sheet_index = mock.Mock(wraps=self.sheet_service.get_sheet_index)
+    self.sheet_service.get_sheet_index = get_sheet_index
+    self.sheet_service.get_sheet_values = mock.Mock(return_value=customer_data)
+
+    with self.sheet_service.cached_reads():
+      for _ in range(2):
+        index = self.sheet_service.get_sheet_range_index(
+            "CustomerList!A6:B", data_references.SheetNames.customers
+        )
+
+    self.assertEqual(index["Customer2"], ["Customer2", "2"])
+    get_sheet_index.assert_called_once()
+
+  @mock.patch("sheet_api.SheetsService.update_sitelinks_columns")
+  def test_update_sitelink_sheet_output_appends_only_new_sitelinks(
+      self, mock_update_sitelinks_columns
+  ):
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    append_request = sheets_service.values().append
+    append_request.reset_mock()
+    self.sheet_service.get_sheet_values = mock.Mock(
+        return_value=[["Resource"], ["resource1"], []]
+    )
+    results = []
+    for resource_name in ("resource1", "resource2", "resource2"):
+      row = mock.MagicMock()
+      row.campaign_asset.resource_name = resource_name
+      results.append(row)
+
+    self.sheet_service.update_sitelink_sheet_output(results, {})
+    append_request.assert_not_called()
+    self.sheet_service.flush_update_requests()
+
+    appended_rows = append_request.call_args.kwargs["body"]["values"]
+    self.assertEqual(
+        [row[data_references.Sitelinks.sitelink_resource]
+         for row in appended_rows],
+        ["resource2"],
+    )
+    mock_update_sitelinks_columns.assert_called_once()
+
+  @mock.patch("sheet_api.SheetsService.get_sheet_id")
+  def test_update_assets_columns_updates_each_column_once_per_run(
+      self, mock_get_sheet_id
+  ):
+    mock_get_sheet_id.return_value = 1
+    response = {"tableRange": "Assets!A5:L10", "updates": {"updatedRows": 3}}
+    sheet_output = []
+    for customer_name in ("Customer1", "Customer1", "Customer2"):
+      sheet_row = [""] * (data_references.Assets.asset_group_asset + 1)
+      sheet_row[data_references.Assets.customer_name] = customer_name
+      sheet_row[data_references.Assets.campaign_name] = "Campaign1"
+      sheet_output.append(sheet_row)
+    account_map = {
+        "Customer1": {"Campaign1": ["Group1"]},
+        "Customer2": {"Campaign1": ["Group2"]},
+    }
+
+    self.sheet_service.update_assets_columns(
+        response, sheet_output, account_map
+    )
+
+    dropdown_ranges = [
+        (
+            request["setDataValidation"]["range"]["startColumnIndex"],
+            request["setDataValidation"]["range"]["startRowIndex"],
+            request["setDataValidation"]["range"]["endRowIndex"],
+        )
+        for request in self.sheet_service._pending_requests
+        if "setDataValidation" in request
+    ]
+    self.assertEqual(
+        dropdown_ranges,
+        [
+            (data_references.Assets.customer_name, 10, 13),
+            (data_references.Assets.campaign_name, 10, 12),
+            (data_references.Assets.campaign_name, 12, 13),
+            (data_references.Assets.asset_group_name, 10, 12),
+            (data_references.Assets.asset_group_name, 12, 13),
+        ],
+    )
+    self.assertEqual(len(self.sheet_service._pending_requests), 6)
+
+  @mock.patch("sheet_api.SheetsService.get_sheet_id")
+  def test_update_assets_columns_skips_asset_groups_of_unknown_campaigns(
+      self, mock_get_sheet_id
+  ):
+    mock_get_sheet_id.return_value = 1
+    response = {"tableRange": "Assets!A5:L10", "updates": {"updatedRows": 2}}
+    sheet_output = []
+    for campaign_name in ("", "Campaign1"):
+      sheet_row = [""] * (data_references.Assets.asset_group_asset + 1)
+      sheet_row[data_references.Assets.customer_name] = "Customer1"
+      sheet_row[data_references.Assets.campaign_name] = campaign_name
+      sheet_output.append(sheet_row)
+    account_map = {"Customer1": {"Campaign1": ["Group1"]}}
+
+    self.sheet_service.update_assets_columns(
+        response, sheet_output, account_map
+    )
+
+    asset_group_ranges = [
+        (
+            request["setDataValidation"]["range"]["startRowIndex"],
+            request["setDataValidation"]["range"]["endRowIndex"],
+        )
+        for request in self.sheet_service._pending_requests
+        if "setDataValidation" in request
+        and request["setDataValidation"]["range"]["startColumnIndex"]
+        == data_references.Assets.asset_group_name
+    ]
+    self.assertEqual(asset_group_ranges, [(11, 12)])
+
+  def test_create_asset_sheet_row_writes_image_url_into_thumbnail(self):
+    row = mock.MagicMock()
+    row.asset_group_asset.field_type.name = (
+        data_references.AssetTypes.marketing_image
+    )
+    row.asset.image_asset.full_size.url = "https://example.com/image.png"
+
+    sheet_row = self.sheet_service.create_asset_sheet_row(row, "resource1")
+
+    self.assertEqual(
+        sheet_row[data_references.Assets.asset_thumbnail],
+        '=IMAGE("https://example.com/image.png")',
+    )
+
+  @mock.patch("sheet_api.SheetsService.update_sheet_lists")
+  def test_refresh_campaign_list_writes_customers_in_order(
+      self, mock_update_sheet_lists
+  ):
+    Customer = namedtuple("Customer", ["id"])
+    ResultRow = namedtuple("ResultRow", ["customer_client"])
+    self.google_ads_service.retrieve_all_customers.return_value = [
+        ResultRow(customer_client=Customer(id=customer_id))
+        for customer_id in ("customer1", "customer2", "customer3")
+    ]
+    self.google_ads_service.retrieve_all_campaigns.side_effect = (
+        lambda customer_id: f"campaigns of {customer_id}"
+    )
+    mock_update_sheet_lists.return_value = {}
+    self.sheet_service.batch_get_sheet_values = mock.MagicMock()
+
+    self.sheet_service.refresh_campaign_list()
+
+    self.assertEqual(
+        [call.args[0] for call in mock_update_sheet_lists.call_args_list[1:]],
+        [
+            "campaigns of customer1",
+            "campaigns of customer2",
+            "campaigns of customer3",
+        ],
+    )
+
+  @mock.patch("sheet_api.SheetsService.update_sheet_lists")
+  def test_refresh_campaign_list_reuses_campaign_ids_for_all_customers(
+      self, mock_update_sheet_lists
+  ):
+    Customer = namedtuple("Customer", ["id"])
+    ResultRow = namedtuple("ResultRow", ["customer_client"])
+    self.google_ads_service.retrieve_all_customers.return_value = [
+        ResultRow(customer_client=Customer(id=customer_id))
+        for customer_id in ("customer1", "customer2")
+    ]
+    mock_update_sheet_lists.return_value = {}
+    self.sheet_service.batch_get_sheet_values = mock.Mock(
+        return_value={
+            sheet_api._CUSTOMER_IDS_RANGE: [],
+            sheet_api._CAMPAIGN_IDS_RANGE: [["1"], [], ["2"]],
+        }
+    )
+
+    self.sheet_service.refresh_campaign_list()
+
+    campaign_calls = mock_update_sheet_lists.call_args_list[1:]
+    self.assertEqual(campaign_calls[0].args[4], {"1", "2"})
+    self.assertIs(campaign_calls[0].args[4], campaign_calls[1].args[4])
+
+  @mock.patch("sheet_api.SheetsService.update_sheet_lists")
+  def test_refresh_asset_group_list_retrieves_customers_once(
+      self, mock_update_sheet_lists
+  ):
+    Customer = namedtuple("Customer", ["id"])
+    ResultRow = namedtuple("ResultRow", ["customer_client"])
+    self.google_ads_service.retrieve_all_customers.return_value = [
+        ResultRow(customer_client=Customer(id="customer1")),
+    ]
+    mock_update_sheet_lists.return_value = {}
+    self.sheet_service.batch_get_sheet_values = mock.MagicMock()
+
+    self.sheet_service.refresh_asset_group_list()
+
+    self.google_ads_service.retrieve_all_customers.assert_called_once()
+    self.google_ads_service.retrieve_all_asset_groups.assert_called_once_with(
+        "customer1"
+    )
+
+  def test_refresh_asset_group_list_reads_id_columns_in_one_request(self):
+    Customer = namedtuple("Customer", ["id", "descriptive_name"])
+    ResultRow = namedtuple("ResultRow", ["customer_client"])
+    self.google_ads_service.retrieve_all_customers.return_value = [
+        ResultRow(customer_client=Customer(id=1, descriptive_name="Name1")),
+    ]
+    self.google_ads_service.retrieve_all_campaigns.return_value = []
+    self.google_ads_service.retrieve_all_asset_groups.return_value = []
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    sheets_service.values().batchGet().execute.return_value = {
+        "valueRanges": [
+            {"range": sheet_api._CUSTOMER_IDS_RANGE, "values": [["1"]]},
+            {"range": sheet_api._CAMPAIGN_IDS_RANGE},
+            {"range": sheet_api._ASSET_GROUP_IDS_RANGE},
+        ]
+    }
+    sheets_service.values.reset_mock()
+
+    self.sheet_service.refresh_asset_group_list()
+
+    sheets_service.values().batchGet.assert_called_once()
+    sheets_service.values().get.assert_not_called()
+
+  def test_map_ahead_submits_a_bounded_number_of_items_ahead(self):
+    executor = mock.Mock()
+    executor.submit.side_effect = lambda function, item: mock.Mock(
+        result=mock.Mock(return_value=function(item))
+    )
+    items = [str(i) for i in range(sheet_api._ADS_MAX_WORKERS + 5)]
+
+    results = sheet_api._map_ahead(executor, lambda item: item + "!", items)
+
+    for consumed, item in enumerate(items, start=1):
+      self.assertEqual(next(results), item + "!")
+      # Results not consumed yet never exceed _ADS_MAX_WORKERS.
+      self.assertEqual(
+          executor.submit.call_count,
+          min(sheet_api._ADS_MAX_WORKERS + consumed - 1, len(items)),
+      )
+    self.assertEqual(list(results), [])
+
+  def test_refresh_spreadsheet_reads_existing_values_in_one_request(self):
+    Customer = namedtuple("Customer", ["id", "descriptive_name"])
+    ResultRow = namedtuple("ResultRow", ["customer_client"])
+    self.google_ads_service.retrieve_all_customers.return_value = [
+        ResultRow(customer_client=Customer(id=1, descriptive_name="Name1")),
+        ResultRow(customer_client=Customer(id=2, descriptive_name="Name2")),
+    ]
+    for retrieve in (
+        self.google_ads_service.retrieve_all_campaigns,
+        self.google_ads_service.retrieve_all_asset_groups,
+        self.google_ads_service.retrieve_all_assets,
+        self.google_ads_service.retrieve_sitelinks,
+    ):
+      retrieve.return_value = []
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    sheets_service.values().batchGet().execute.return_value = {
+        "valueRanges": [
+            {"range": sheet_api._CUSTOMER_IDS_RANGE, "values": [["1"], ["2"]]},
+            {"range": sheet_api._CAMPAIGN_IDS_RANGE},
+            {"range": sheet_api._ASSET_GROUP_IDS_RANGE},
+            {"range": sheet_api._ASSET_RESOURCE_RANGE},
+            {"range": sheet_api._SITELINK_RESOURCE_RANGE},
+        ]
+    }
+    sheets_service.values.reset_mock()
+
+    self.sheet_service.refresh_spreadsheet()
+
+    sheets_service.values().batchGet.assert_called_once()
+    sheets_service.values().get.assert_not_called()
+    sheets_service.values().update.assert_not_called()
+    batch_update_requests = sheets_service.batchUpdate.call_args.kwargs[
+        "body"
+    ]["requests"]
+    self.assertEqual(
+        batch_update_requests[-1]["updateCells"]["rows"][0]["values"][0][
+            "userEnteredValue"
+        ]["formulaValue"],
+        sheet_api._CUSTOMER_DROPDOWN_FORMULA,
+    )
+
+  @mock.patch("sheet_api.SheetsService.update_sitelinks_columns")
+  def test_sitelinks_of_several_customers_are_appended_in_one_request(
+      self, mock_update_sitelinks_columns
+  ):
+    sheets_service = mock.MagicMock()
+    self.sheet_service._sheets_service = sheets_service
+    append_request = sheets_service.values().append
+    append_request.reset_mock()
+    existing_resource_names = set()
+    for resource_name in ("resource1", "resource2"):
+      row = mock.MagicMock()
+      row.campaign_asset.resource_name = resource_name
+      self.sheet_service.update_sitelink_sheet_output(
+          [row], {}, existing_resource_names
+      )
+
+    self.sheet_service.flush_update_requests()
+
+    append_request.assert_called_once()
+    appended_rows = mock_update_sitelinks_columns.call_args.args[1]
+    self.assertEqual(
+        [row[data_references.Sitelinks.sitelink_resource]
+         for row in appended_rows],
+        ["resource1", "resource2"],
+    )
@@ -32,8 +32,8 @@ class TestUtils(unittest.TestCase):
     """Test Retrieve Customer ID when match in sheet."""
     customer_name = "customer_name_1"
     customer_id = "customer_id_1"
-    mock_sheets_service.get_sheet_values.return_value = [
-        [customer_name, customer_id]]
+    mock_sheets_service.get_sheet_range_index.return_value = {
+        customer_name: [customer_name, customer_id]}
 
     self.assertEqual(utils.retrieve_customer_id(
         customer_name, mock_sheets_service), customer_id)
@@ -41,8 +41,8 @@ class TestUtils(unittest.TestCase):
   @mock.patch("sheet_api.SheetsService")
   def test_retrieve_customer_id_not_in_sheet(self, mock_sheets_service):
     """Test Retrieve Customer ID when no match in sheet."""
-    mock_sheets_service.get_sheet_values.return_value = [
-        ["Other_Customer", "Other_Customer_Id"]]
+    mock_sheets_service.get_sheet_range_index.return_value = {
+        "Other_Customer": ["Other_Customer", "Other_Customer_Id"]}
 
     self.assertIsNone(utils.retrieve_customer_id(
         "customer_name_1", mock_sheets_service))
@@ -163,9 +163,11 @@ class TestUtils(unittest.TestCase):
     customer_id = "customer_id_1"
     campaign_name = "campaign_name_1"
     campaign_id = "campaign_id_1"
-    mock_sheets_service.get_sheet_values.return_value = [
-        [customer_name, customer_id, campaign_name, campaign_id]
-    ]
+    mock_sheets_service.get_sheet_range_index.return_value = {
+        (customer_name, campaign_name): [
+            customer_name, customer_id, campaign_name, campaign_id
+        ]
+    }
 
     self.assertEqual(
         utils.retrieve_campaign_id(
@@ -175,8 +177,12 @@ class TestUtils(unittest.TestCase):
   @mock.patch("sheet_api.SheetsService")
   def test_retrieve_campaign_id_not_in_sheet(self, mock_sheets_service):
     """Test Retrieve campaign ID when no match in sheet."""
-    mock_sheets_service.get_sheet_values.return_value = [
-        ["Other_campaign", "Other_campaign_Id"]]
+    mock_sheets_service.get_sheet_range_index.return_value = {
+        ("customer_name_1", "Other_campaign"): [
+            "customer_name_1", "customer_id_1", "Other_campaign",
+            "Other_campaign_Id"
+        ]
+    }
 
     self.assertIsNone(utils.retrieve_campaign_id(
         "customer_name_1", "campaign_name_1", mock_sheets_service))
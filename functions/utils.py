@@ -200,15 +200,15 @@ def retrieve_customer_id(
   Returns:
     Str or None. String value containing the Google Ads customer id.
   """
-  customer_data: Sequence[Sequence[str]] = sheet_service.get_sheet_values(
+  customer_index = sheet_service.get_sheet_range_index(
       data_references.SheetNames.customers
       + "!"
-      + data_references.SheetRanges.customers
+      + data_references.SheetRanges.customers,
+      data_references.SheetNames.customers,
   )
 
-  for row in customer_data:
-    if customer_name in row:
-      return row[data_references.CustomerList.customer_id]
+  if row := customer_index.get(customer_name):
+    return row[data_references.CustomerList.customer_id]
 
   return None
 
@@ -227,15 +227,16 @@ def retrieve_campaign_id(
     Tuple or None. Tuple containing the Google Ads customer id and campaign id.
     (customer_id, campaign_id)
   """
-  campaign_data: Sequence[Sequence[str]] = sheet_service.get_sheet_values(
+  campaign_index = sheet_service.get_sheet_range_index(
       f"{data_references.SheetNames.campaigns}!"
-      f"{data_references.SheetRanges.campaigns}"
+      f"{data_references.SheetRanges.campaigns}",
+      data_references.SheetNames.campaigns,
   )
-  for row in campaign_data:
-    if campaign_name in row and customer_name in row:
-      return (
-          row[data_references.CampaignList.customer_id],
-          row[data_references.CampaignList.campaign_id],
-      )
+
+  if row := campaign_index.get((customer_name, campaign_name)):
+    return (
+        row[data_references.CampaignList.customer_id],
+        row[data_references.CampaignList.campaign_id],
+    )
 
   return None